@@ -3,7 +3,10 @@ Database Initialization Script
 Creates and initializes the RFAI database with complete schema
 """
 
+import os
 import sqlite3
+import threading
+import time
 from pathlib import Path
 import logging
 
@@ -30,9 +33,15 @@ def init_database(db_path=None):
     cursor = conn.cursor()
     
     try:
+        # 8 KiB pages halve page reads for the wide log rows; only takes
+        # effect on a new (empty) database and is a no-op afterwards
+        cursor.execute("PRAGMA page_size=8192")
+        
         # Execute schema
         cursor.executescript(schema_sql)
         conn.commit()
+        # Gather planner statistics for any index that still lacks them
+        cursor.execute("PRAGMA optimize")
         logger.info("Database schema created successfully")
         
         # Verify tables
@@ -49,6 +58,40 @@ def init_database(db_path=None):
     finally:
         conn.close()
 
+_id_lock = threading.Lock()
+_last_id_ms = 0
+_id_seq = 0
+
+
+def new_id():
+    """
+    Generate a time-ordered UUIDv7 as a 32-char hex string for TEXT primary keys
+    
+    Unlike uuid4, consecutive IDs sort in creation order, so inserts append to
+    the right edge of the primary-key B-tree instead of splitting random pages.
+    IDs generated in the same millisecond are ordered by a 12-bit sequence.
+    """
+    global _last_id_ms, _id_seq
+    
+    now_ms = time.time_ns() // 1_000_000
+    with _id_lock:
+        if now_ms > _last_id_ms:
+            _last_id_ms = now_ms
+            # Random start leaves most of the sequence space for same-ms IDs
+            _id_seq = int.from_bytes(os.urandom(2), 'big') & 0x3FF
+        else:
+            _id_seq += 1
+            if _id_seq > 0xFFF:
+                # Sequence exhausted: borrow the next millisecond
+                _last_id_ms += 1
+                _id_seq = 0
+        ms, seq = _last_id_ms, _id_seq
+    
+    rand_b = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+    return f'{value:032x}'
+
+
 def get_db_connection(db_path=None):
     """Get a connection to the database"""
     if db_path is None:
@@ -57,6 +100,61 @@ def get_db_connection(db_path=None):
     
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    # WAL lets readers run alongside the writer; NORMAL skips the fsync per
+    # commit (still durable at checkpoints, safe against corruption in WAL mode)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+class PooledConnection(sqlite3.Connection):
+    """
+    Connection kept open for reuse by get_pooled_connection()
+    
+    close() releases the connection back to its thread instead of closing it,
+    rolling back anything left uncommitted so the next caller starts clean.
+    """
+    
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+    
+    def dispose(self):
+        """Really close the underlying database handle"""
+        super().close()
+
+
+_pool = threading.local()
+
+
+def get_pooled_connection(db_path=None):
+    """
+    Get this thread's persistent connection to the database
+    
+    Connections are opened once per thread and database file and then reused,
+    so per-call connect and PRAGMA setup is paid only on first use.
+    """
+    if db_path is None:
+        db_path = Path.home() / ".rfai" / "data" / "rfai.db"
+    db_path = str(db_path)
+    
+    connections = getattr(_pool, 'connections', None)
+    if connections is None:
+        connections = _pool.connections = {}
+    
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, factory=PooledConnection)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Read pages through a shared memory map instead of a read() per page
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        connections[db_path] = conn
+    elif conn.in_transaction:
+        # A previous caller raised before close(); don't inherit its writes
+        conn.rollback()
     return conn
 
 if __name__ == "__main__":
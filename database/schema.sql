@@ -344,6 +344,11 @@ CREATE INDEX IF NOT EXISTS idx_content_type ON content_items(type, difficulty);
 CREATE INDEX IF NOT EXISTS idx_quiz_results_score ON quiz_results(quiz_id, score);
 CREATE INDEX IF NOT EXISTS idx_plan_days_plan ON plan_days(plan_id, week_number, day_number);
 CREATE INDEX IF NOT EXISTS idx_goals_status ON goals(status);
+CREATE INDEX IF NOT EXISTS idx_ratings_timestamp ON ratings(timestamp);
+CREATE INDEX IF NOT EXISTS idx_attention_log_timestamp ON attention_log(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_attention_log_session ON attention_log(session_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_block_activity_session ON block_activity_log(session_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_session_content_session ON session_content_log(session_id, id);
 
 -- Initial Configuration Data
 -- ============================================
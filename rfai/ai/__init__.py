@@ -1,20 +1,34 @@
 """
 AI Components for RFAI
 Contains all intelligent agents for personalized learning
+
+Components are imported on first attribute access so that importing a single
+submodule (e.g. ``rfai.ai.time_block_content``) doesn't pull in numpy,
+scikit-learn and pandas.
 """
 
-from .pace_learner_rl import PaceLearnerRL
-from .content_digest_ai import ContentDigestAI
-from .srs_engine import AdaptiveSRS
-from .schedule_optimizer import ScheduleOptimizerAI
-from .plan_format_processor import PlanFormatProcessor
-from .plan_generator import PlanGeneratorAI
-
-__all__ = [
-    'PaceLearnerRL',
-    'ContentDigestAI',
-    'AdaptiveSRS',
-    'ScheduleOptimizerAI',
-    'PlanFormatProcessor',
-    'PlanGeneratorAI',
-]
+import importlib
+
+_LAZY_COMPONENTS = {
+    'PaceLearnerRL': '.pace_learner_rl',
+    'ContentDigestAI': '.content_digest_ai',
+    'AdaptiveSRS': '.srs_engine',
+    'ScheduleOptimizerAI': '.schedule_optimizer',
+    'PlanFormatProcessor': '.plan_format_processor',
+    'PlanGeneratorAI': '.plan_generator',
+}
+
+__all__ = list(_LAZY_COMPONENTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -35,32 +35,72 @@ class ContentScheduler:
             interests_file: Path to interests configuration
             plan_file: Path to learning plan
         """
+        self.interests_file = interests_file
+        self.plan_file = plan_file
         self.interests = self._load_interests(interests_file)
         self.plan_parser = LearningPlanParser(plan_file)
         
+        # Input files are only re-parsed when their (mtime, size) changes,
+        # and generated schedules are reused for the rest of the day
+        self._input_signature = self._get_input_signature()
+        self._schedule_cache: Dict = {}
+        
         # Initialize integrations
         self.youtube = YouTubeDiscovery()
         self.arxiv = ArXivDiscovery()
         self.edx = EdXDiscovery()
         self.imdb = IMDBDiscovery()
         
-        # Get time allocations from interests
+        self._apply_time_allocation()
+        
+        logger.info(f"Content scheduler initialized: {self.youtube_hours}h YouTube, "
+                   f"{self.movie_hours}h movies, {self.paper_hours}h papers")
+    
+    def _apply_time_allocation(self):
+        """Get time allocations from interests"""
         self.time_allocation = self.interests.get('time_allocation', {})
         self.youtube_hours = self.time_allocation.get('breakdown', {}).get('youtube_learning', 1.0)
         self.movie_hours = self.time_allocation.get('breakdown', {}).get('artistic_movies', 1.5)
         self.paper_hours = self.time_allocation.get('breakdown', {}).get('research_papers', 1.0)
-        
-        logger.info(f"Content scheduler initialized: {self.youtube_hours}h YouTube, "
-                   f"{self.movie_hours}h movies, {self.paper_hours}h papers")
+    
+    @staticmethod
+    def _resolve_path(filename: str) -> Path:
+        """Resolve a config file, falling back to the project root"""
+        file_path = Path(filename)
+        if not file_path.exists():
+            # Try relative to project root
+            project_root = Path(__file__).parent.parent.parent
+            file_path = project_root / filename
+        return file_path
+    
+    def _get_input_signature(self) -> tuple:
+        """(mtime, size) of the interests and plan files, None if missing"""
+        signature = []
+        for filename in (self.interests_file, self.plan_file):
+            try:
+                stat = self._resolve_path(filename).stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _refresh_inputs(self):
+        """Re-parse the input files if either changed on disk"""
+        signature = self._get_input_signature()
+        if signature == self._input_signature:
+            return
+        
+        logger.info("Schedule inputs changed on disk, reloading")
+        self.interests = self._load_interests(self.interests_file)
+        self.plan_parser = LearningPlanParser(self.plan_file)
+        self._apply_time_allocation()
+        self._input_signature = signature
+        self._schedule_cache.clear()
     
     def _load_interests(self, interests_file: str) -> Dict:
         """Load user interests configuration"""
         try:
-            file_path = Path(interests_file)
-            if not file_path.exists():
-                # Try relative to project root
-                project_root = Path(__file__).parent.parent.parent
-                file_path = project_root / interests_file
+            file_path = self._resolve_path(interests_file)
             
             with open(file_path, 'r') as f:
                 interests = json.load(f)
@@ -75,6 +115,9 @@ class ContentScheduler:
         """
         Generate complete daily schedule
         
+        The schedule for a given day is cached until the day changes or the
+        interests/plan files are modified.
+        
         Args:
             date: Date to schedule for (default: today)
         
@@ -84,6 +127,12 @@ class ContentScheduler:
         if date is None:
             date = datetime.now()
         
+        self._refresh_inputs()
+        
+        cached = self._schedule_cache.get(date.date())
+        if cached is not None:
+            return cached
+        
         logger.info(f"Generating schedule for {date.date()}")
         
         # Get current learning plan day
@@ -114,6 +163,9 @@ class ContentScheduler:
         schedule['content_blocks'].append(movie_block)
         
         logger.info(f"Generated schedule with {len(schedule['content_blocks'])} content blocks")
+        
+        # Only today's schedule is worth keeping around
+        self._schedule_cache = {date.date(): schedule}
         return schedule
     
     def _schedule_youtube_block(self, interests: Dict, 
@@ -8,7 +8,12 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List
-import sqlite3
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.init_db import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +40,7 @@ class DataCollector:
         for AI training
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             # Get session
@@ -52,31 +56,35 @@ class DataCollector:
             """, (session_id,))
             content_log = [dict(row) for row in cursor.fetchall()]
             
-            # Get attention data during session
+            # Aggregate attention during session in SQL rather than pulling
+            # every sample into Python
             cursor.execute("""
-                SELECT timestamp, state, score, confidence
+                SELECT COUNT(*) AS samples,
+                       AVG(score) AS avg_score,
+                       MAX(score) AS max_score,
+                       MIN(score) AS min_score,
+                       TOTAL(state = 'FOCUSED') AS focused,
+                       TOTAL(state = 'DISTRACTED') AS distracted
                 FROM attention_log
                 WHERE timestamp >= ? AND timestamp <= ?
-                ORDER BY timestamp
             """, (session['start_time'], session['end_time'] or datetime.now()))
-            attention_data = [dict(row) for row in cursor.fetchall()]
+            attention = cursor.fetchone()
             
             conn.close()
             
             # Aggregate metrics
-            if attention_data:
-                attention_scores = [a['score'] for a in attention_data]
-                avg_attention = sum(attention_scores) / len(attention_scores)
-                max_attention = max(attention_scores)
-                min_attention = min(attention_scores)
+            if attention['avg_score'] is not None:
+                avg_attention = attention['avg_score']
+                max_attention = attention['max_score']
+                min_attention = attention['min_score']
             else:
-                avg_attention = session.get('attention_average', 0)
+                avg_attention = session.get('attention_average') or 0
                 max_attention = avg_attention
                 min_attention = avg_attention
             
             # Categorize attention
-            focused_time = sum(1 for a in attention_data if a['state'] == 'FOCUSED')
-            distracted_time = sum(1 for a in attention_data if a['state'] == 'DISTRACTED')
+            focused_time = int(attention['focused'])
+            distracted_time = int(attention['distracted'])
             
             return {
                 'session_id': session_id,
@@ -91,7 +99,7 @@ class DataCollector:
                     'min_attention': round(min_attention, 2),
                     'focused_samples': focused_time,
                     'distracted_samples': distracted_time,
-                    'total_samples': len(attention_data)
+                    'total_samples': attention['samples']
                 },
                 'content': {
                     'items_shown': len(content_log),
@@ -116,8 +124,7 @@ class DataCollector:
             Dataset ready for ML model training
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -22,6 +23,8 @@ class MultiSourceDiscovery:
     Sources: ArXiv, EdX, YouTube, IMDB, Perplexity, Notion
     """
     
+    PERPLEXITY_RESOURCE_TYPES = ('tutorial', 'article', 'documentation')
+    
     def __init__(self):
         """Initialize all discovery sources"""
         self.sources = {}
@@ -88,55 +91,65 @@ class MultiSourceDiscovery:
             logger.debug(f"Notion init failed: {e}")
     
     def discover_all(self, topic: str, subtopics: List[str] = None,
-                    max_per_source: int = 5) -> Dict[str, List[Dict]]:
+                    max_per_source: int = 5, timeout: float = 30) -> Dict[str, List[Dict]]:
         """
         Discover content from all sources in parallel
         
+        Every outgoing request is its own task (Perplexity's per-resource-type
+        queries included), so total latency is bounded by the slowest single
+        request rather than the sum of a source's requests.
+        
         Args:
             topic: Main topic
             subtopics: Optional subtopics
             max_per_source: Max items per source
+            timeout: Overall deadline in seconds for all sources
         
         Returns:
             Dict mapping source_name -> list of content items
         """
-        results = {}
+        tasks = []
+        if 'youtube' in self.sources:
+            tasks.append(('youtube', self._discover_youtube,
+                          (topic, subtopics, max_per_source)))
+        if 'perplexity' in self.sources:
+            for resource_type in self.PERPLEXITY_RESOURCE_TYPES:
+                tasks.append(('perplexity', self._discover_perplexity,
+                              (topic, resource_type, max_per_source)))
+        if 'imdb' in self.sources:
+            tasks.append(('imdb', self._discover_imdb, (topic, max_per_source)))
+        if 'notion' in self.sources:
+            tasks.append(('notion', self._discover_notion, (topic, max_per_source)))
+        
+        if not tasks:
+            return {}
+        
+        results = {source: [] for source, _, _ in tasks}
         
         # Use thread pool for parallel discovery
-        with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
-            futures = {}
-            
-            # Submit discovery tasks
-            if 'youtube' in self.sources:
-                futures[executor.submit(
-                    self._discover_youtube, topic, subtopics, max_per_source
-                )] = 'youtube'
-            
-            if 'perplexity' in self.sources:
-                futures[executor.submit(
-                    self._discover_perplexity, topic, max_per_source
-                )] = 'perplexity'
-            
-            if 'imdb' in self.sources:
-                futures[executor.submit(
-                    self._discover_imdb, topic, max_per_source
-                )] = 'imdb'
-            
-            if 'notion' in self.sources:
-                futures[executor.submit(
-                    self._discover_notion, topic, max_per_source
-                )] = 'notion'
-            
+        executor = ThreadPoolExecutor(max_workers=len(tasks))
+        futures = {
+            executor.submit(fn, *args): source
+            for source, fn, args in tasks
+        }
+        
+        try:
             # Collect results as they complete
-            for future in as_completed(futures):
+            for future in as_completed(futures, timeout=timeout):
                 source = futures[future]
                 try:
-                    items = future.result(timeout=30)
-                    results[source] = items
-                    logger.info(f"✓ {source}: {len(items)} items")
+                    results[source].extend(future.result())
                 except Exception as e:
                     logger.error(f"✗ {source} discovery failed: {e}")
-                    results[source] = []
+        except FuturesTimeoutError:
+            pending = sorted({futures[f] for f in futures if not f.done()})
+            logger.error(f"✗ Discovery timed out after {timeout}s waiting on: {', '.join(pending)}")
+        finally:
+            # Don't block the caller on stragglers past the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        for source, items in results.items():
+            logger.info(f"✓ {source}: {len(items)} items")
         
         return results
     
@@ -149,19 +162,15 @@ class MultiSourceDiscovery:
         
         return yt.search_by_topic(topic, subtopics, max_per_topic=max_results)
     
-    def _discover_perplexity(self, topic: str, max_results: int) -> List[Dict]:
-        """Discover resources via Perplexity"""
+    def _discover_perplexity(self, topic: str, resource_type: str,
+                             max_results: int) -> List[Dict]:
+        """Discover resources of one type via Perplexity"""
         perp = self.sources.get('perplexity')
         if not perp:
             return []
         
-        # Try multiple resource types
-        all_resources = []
-        for resource_type in ['tutorial', 'article', 'documentation']:
-            resources = perp.find_resources(topic, resource_type)
-            all_resources.extend(resources[:max_results // 3])
-        
-        return all_resources[:max_results]
+        per_type = max_results // len(self.PERPLEXITY_RESOURCE_TYPES)
+        return perp.find_resources(topic, resource_type)[:per_type]
     
     def _discover_imdb(self, topic: str, max_results: int) -> List[Dict]:
         """Discover educational movies/documentaries"""
@@ -4,7 +4,6 @@ Uses Ollama (local LLM) or Perplexity API, with template fallback
 """
 
 import json
-import uuid
 from typing import Dict, List, Optional
 import logging
 import sys
@@ -13,6 +12,8 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from database.init_db import new_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,7 +136,7 @@ class PlanGeneratorAI:
     
     def _generate_template_based(self, topic: str, context: Dict) -> Dict:
         """Generate plan using templates (fallback when no API)"""
-        plan_id = str(uuid.uuid4())
+        plan_id = new_id()
         
         # Dynamic duration estimation based on topic complexity and user
         weeks = self._estimate_duration(topic, context)
@@ -309,7 +310,7 @@ class PlanGeneratorAI:
     
     def _generate_learning_day(self, week_num: int, day_num: int, topic: str, difficulty: int) -> Dict:
         """Generate a learning day template"""
-        day_id = str(uuid.uuid4())
+        day_id = new_id()
         
         return {
             "id": day_id,
@@ -351,7 +352,7 @@ class PlanGeneratorAI:
     
     def _generate_review_day(self, week_num: int, day_num: int, topic: str) -> Dict:
         """Generate a review/quiz day (Sunday)"""
-        day_id = str(uuid.uuid4())
+        day_id = new_id()
         
         return {
             "id": day_id,
@@ -8,9 +8,64 @@ import uuid
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.init_db import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
+# Per-topic running totals over quiz_results, kept current by a trigger so the
+# progress summary reads one row per topic instead of scanning every result
+PROGRESS_SUMMARY_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS progress_summary (
+        topic TEXT PRIMARY KEY,
+        attempts INTEGER NOT NULL,
+        total_score REAL NOT NULL,
+        highest_score REAL,
+        lowest_score REAL,
+        last_update TEXT
+    )
+    """,
+    # Backfill from results saved before the trigger existed
+    """
+    INSERT OR REPLACE INTO progress_summary
+    SELECT COALESCE(q.topic, ''), COUNT(*), TOTAL(qr.score_percentage),
+           MAX(qr.score_percentage), MIN(qr.score_percentage), MAX(qr.submitted_at)
+    FROM quiz_results qr
+    JOIN quizzes q ON qr.quiz_id = q.quiz_id
+    GROUP BY COALESCE(q.topic, '')
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_quiz_results_submitted ON quiz_results(submitted_at)",
+    # The first version of the trigger let a NULL score wipe out the
+    # highest/lowest scores; the backfill above has just recomputed them
+    "DROP TRIGGER IF EXISTS trg_quiz_results_summary",
+    # Created last: its presence marks the whole setup as complete
+    """
+    CREATE TRIGGER trg_quiz_results_summary_v2 AFTER INSERT ON quiz_results
+    BEGIN
+        INSERT INTO progress_summary
+        SELECT COALESCE(q.topic, ''), 1, IFNULL(NEW.score_percentage, 0),
+               NEW.score_percentage, NEW.score_percentage, NEW.submitted_at
+        FROM quizzes q
+        WHERE q.quiz_id = NEW.quiz_id
+        ON CONFLICT(topic) DO UPDATE SET
+            attempts = attempts + 1,
+            total_score = total_score + excluded.total_score,
+            -- Scalar MAX/MIN return NULL if either side is NULL; skip NULL
+            -- scores the way the aggregate MAX/MIN of the backfill do
+            highest_score = MAX(COALESCE(highest_score, excluded.highest_score),
+                                COALESCE(excluded.highest_score, highest_score)),
+            lowest_score = MIN(COALESCE(lowest_score, excluded.lowest_score),
+                               COALESCE(excluded.lowest_score, lowest_score)),
+            last_update = excluded.last_update;
+    END
+    """,
+)
+
 
 class ProgressTester:
     """
@@ -25,6 +80,7 @@ class ProgressTester:
             config_path = Path.cwd() / "interests.json"
         self.config_path = config_path
         self.config = self._load_config()
+        self._summary_ready = False
     
     def _load_config(self) -> Dict:
         """Load configuration"""
@@ -93,8 +149,7 @@ class ProgressTester:
     def _save_quiz(self, quiz: Dict):
         """Save quiz to database"""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -157,8 +212,7 @@ class ProgressTester:
     def _load_quiz(self, quiz_id: str) -> Optional[Dict]:
         """Load quiz from database"""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -220,8 +274,7 @@ class ProgressTester:
     def _save_quiz_results(self, quiz_id: str, answers: Dict, results: Dict):
         """Save quiz results to database"""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -237,6 +290,7 @@ class ProgressTester:
                     FOREIGN KEY (quiz_id) REFERENCES quizzes(quiz_id)
                 )
             """)
+            self._ensure_progress_summary(cursor)
             
             result_id = str(uuid.uuid4())
             cursor.execute("""
@@ -260,10 +314,27 @@ class ProgressTester:
         except Exception as e:
             logger.error(f"Error saving quiz results: {e}")
     
+    def _ensure_progress_summary(self, cursor):
+        """Create (and backfill) the trigger-maintained progress_summary table once"""
+        if self._summary_ready:
+            return
+        
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'trigger' AND name = 'trg_quiz_results_summary_v2'
+        """)
+        if cursor.fetchone() is None:
+            for statement in PROGRESS_SUMMARY_DDL:
+                cursor.execute(statement)
+        self._summary_ready = True
+    
     def get_progress_summary(self, topic: Optional[str] = None) -> Dict:
         """
         Get learning progress summary across all quizzes
         
+        Totals come from the per-topic progress_summary rows; only the ten
+        most recent results are read from quiz_results.
+        
         Args:
             topic: Optional topic filter
         
@@ -271,30 +342,23 @@ class ProgressTester:
             Dict with aggregated progress stats
         """
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
+            self._ensure_progress_summary(cursor)
+            conn.commit()
             
-            if topic:
-                cursor.execute("""
-                    SELECT qr.*, q.topic
-                    FROM quiz_results qr
-                    JOIN quizzes q ON qr.quiz_id = q.quiz_id
-                    WHERE q.topic = ?
-                    ORDER BY qr.submitted_at DESC
-                """, (topic,))
-            else:
-                cursor.execute("""
-                    SELECT qr.*, q.topic
-                    FROM quiz_results qr
-                    JOIN quizzes q ON qr.quiz_id = q.quiz_id
-                    ORDER BY qr.submitted_at DESC
-                """)
+            params = (topic,) if topic else ()
             
-            rows = cursor.fetchall()
-            conn.close()
+            cursor.execute(f"""
+                SELECT topic, attempts, total_score, highest_score, lowest_score
+                FROM progress_summary
+                {"WHERE topic = ?" if topic else ""}
+            """, params)
+            summaries = cursor.fetchall()
             
-            if not rows:
+            total_quizzes = sum(row['attempts'] for row in summaries)
+            if not total_quizzes:
+                conn.close()
                 return {
                     'total_quizzes': 0,
                     'average_score': 0,
@@ -302,28 +366,29 @@ class ProgressTester:
                     'recent_quizzes': []
                 }
             
-            # Calculate stats
-            scores = [row[3] for row in rows]  # score_percentage column
-            topics = list(set([row[7] for row in rows]))  # topic column
+            cursor.execute(f"""
+                SELECT qr.quiz_id, q.topic, qr.submitted_at, qr.score_percentage,
+                       qr.correct_count, qr.total_questions
+                FROM quiz_results qr
+                JOIN quizzes q ON qr.quiz_id = q.quiz_id
+                {"WHERE q.topic = ?" if topic else ""}
+                ORDER BY qr.submitted_at DESC
+                LIMIT 10
+            """, params)
+            recent_quizzes = [dict(row) for row in cursor]  # Last 10 quizzes
+            conn.close()
             
-            recent_quizzes = []
-            for row in rows[:10]:  # Last 10 quizzes
-                recent_quizzes.append({
-                    'quiz_id': row[1],
-                    'topic': row[7],
-                    'submitted_at': row[2],
-                    'score_percentage': row[3],
-                    'correct_count': row[4],
-                    'total_questions': row[5]
-                })
+            highest = [row['highest_score'] for row in summaries if row['highest_score'] is not None]
+            lowest = [row['lowest_score'] for row in summaries if row['lowest_score'] is not None]
             
             return {
-                'total_quizzes': len(rows),
-                'average_score': sum(scores) / len(scores),
-                'topics_covered': topics,
+                'total_quizzes': total_quizzes,
+                'average_score': sum(row['total_score'] for row in summaries) / total_quizzes,
+                'topics_covered': [row['topic'] for row in summaries],
                 'recent_quizzes': recent_quizzes,
-                'highest_score': max(scores),
-                'lowest_score': min(scores)
+                # None for topics whose results all lack a score
+                'highest_score': max(highest, default=None),
+                'lowest_score': min(lowest, default=None)
             }
         except Exception as e:
             logger.error(f"Error getting progress summary: {e}")
@@ -8,7 +8,12 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict
-import sqlite3
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.init_db import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +51,7 @@ class SessionManager:
             Session dict with ID and metadata
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             session_id = f"{block_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -148,7 +152,7 @@ class SessionManager:
         
         # Log to database
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -205,7 +209,7 @@ class SessionManager:
             }
             
             # Save to database
-            conn = sqlite3.connect(self.db_path)
+            conn = get_pooled_connection(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -4,8 +4,10 @@ Returns content (YouTube videos, papers, movies) based on current time block
 and attentiveness state
 """
 
+import bisect
 import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -30,8 +32,10 @@ class TimeBlockContentManager:
         
         self.config_path = config_path
         self.config = self._load_config()
+        self._index_blocks()
         self.manual_override_block = None  # Manual override
         self.current_block = self._get_current_block()
+        self._block_info_cache = None  # (second, current block, info)
         
     def _load_config(self) -> Dict:
         """Load configuration from interests.json"""
@@ -42,6 +46,34 @@ class TimeBlockContentManager:
             logger.error(f"Failed to load config: {e}")
             return {}
     
+    def _index_blocks(self):
+        """
+        Sort schedule blocks by start time for bisect lookups
+        
+        Times are zero-padded "HH:MM" strings, so they sort chronologically.
+        """
+        schedule = self.config.get('daily_schedule', {}).get('time_blocks', [])
+        blocks = sorted(
+            (block for block in schedule if block.get('start_time') and block.get('end_time')),
+            key=lambda block: block['start_time']
+        )
+        self._block_starts = [block['start_time'] for block in blocks]
+        self._blocks_by_start = blocks
+    
+    def _find_block(self, current_time: str) -> Optional[Dict]:
+        """
+        Find the block whose [start_time, end_time] contains current_time
+        
+        Assumes blocks do not overlap (and no overnight blocks), so only the
+        latest block starting at or before current_time can contain it.
+        """
+        i = bisect.bisect_right(self._block_starts, current_time) - 1
+        if i >= 0:
+            block = self._blocks_by_start[i]
+            if current_time <= block['end_time']:
+                return block
+        return None
+    
     def _get_current_block(self) -> Optional[Dict]:
         """
         Determine current time block based on daily schedule
@@ -66,27 +98,14 @@ class TimeBlockContentManager:
             now = datetime.now(local_tz)
             current_time = now.strftime("%H:%M")
             
-            schedule = self.config.get('daily_schedule', {}).get('time_blocks', [])
-            
-            for block in schedule:
-                start = block.get('start_time')
-                end = block.get('end_time')
-                
-                # Simple time comparison (assumes no overnight blocks)
-                if start <= current_time <= end:
-                    return block
-            
-            return None
+            return self._find_block(current_time)
         except Exception as e:
             logger.debug(f"Error determining time block: {e}")
             # Fallback to UTC if timezone fails
             try:
                 now = datetime.now()
                 current_time = now.strftime("%H:%M")
-                schedule = self.config.get('daily_schedule', {}).get('time_blocks', [])
-                for block in schedule:
-                    if block.get('start_time') <= current_time <= block.get('end_time'):
-                        return block
+                return self._find_block(current_time)
             except:
                 pass
             return None
@@ -124,9 +143,24 @@ class TimeBlockContentManager:
         """
         Get current time block information
         
+        Results are memoized for the rest of the wall-clock second (or until
+        the current block changes), since the frontend and access checks poll
+        this far more often than it can change. Callers must not mutate it.
+        
         Returns:
             Dict with block details or empty dict if no active block
         """
+        now_second = int(time.time())
+        cached = self._block_info_cache
+        if cached is not None and cached[0] == now_second and cached[1] is self.current_block:
+            return cached[2]
+        
+        info = self._build_block_info()
+        self._block_info_cache = (now_second, self.current_block, info)
+        return info
+    
+    def _build_block_info(self) -> Dict:
+        """Compute get_block_info() without memoization"""
         if self.current_block:
             return {
                 'active': True,
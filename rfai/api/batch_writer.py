@@ -0,0 +1,110 @@
+"""
+Batched Write Queue
+Collects high-frequency INSERTs from request handlers and commits them from a
+background thread, many rows per transaction
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class BatchWriter:
+    """
+    Background flusher for fire-and-forget database writes
+
+    - submit() only enqueues, so callers never wait on SQLite
+    - Rows are written with executemany in one transaction every
+      flush_interval seconds or once max_batch rows are waiting
+    - Rows for one statement keep their submission order; statements run in
+      the order they first appear in the batch, so callers must not rely on
+      ordering between different statements
+    - The worker thread starts on first use (so it is created in the
+      serving process, not in a parent that later forks)
+    """
+
+    def __init__(self, connect, flush_interval: float = 0.5, max_batch: int = 100):
+        """
+        Args:
+            connect: Callable returning a database connection
+            flush_interval: Longest time (seconds) a row waits before commit
+            max_batch: Rows that trigger an immediate flush
+        """
+        self.connect = connect
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, sql: str, params: tuple):
+        """Queue one statement for the next batch"""
+        if self._thread is None:
+            self._start()
+        self._queue.put((sql, params))
+
+    def close(self, timeout: float = 5.0):
+        """Flush everything queued so far and stop the worker"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="batch-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        conn = self.connect()
+        try:
+            # All rows for a statement share one executemany, even when
+            # callers interleave statements (e.g. block activity + content)
+            rows_by_sql = {}
+            for sql, params in batch:
+                rows_by_sql.setdefault(sql, []).append(params)
+
+            cursor = conn.cursor()
+            for sql, rows in rows_by_sql.items():
+                cursor.executemany(sql, rows)
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} queued writes: {e}")
+            conn.rollback()
+        finally:
+            conn.close()
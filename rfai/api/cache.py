@@ -0,0 +1,108 @@
+"""
+Response Caching Helpers
+In-process caches for API payloads that are expensive to rebuild but change slowly
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+
+class SWRCache:
+    """
+    Thread-safe stale-while-revalidate cache
+
+    - Fresh entries (younger than ttl) are returned as-is
+    - Stale entries (younger than stale_ttl) are returned immediately while a
+      background thread recomputes them
+    - Missing or expired entries are computed synchronously
+    - At most maxsize entries are kept; the least recently used is evicted
+    """
+
+    def __init__(self, ttl: float = 60, stale_ttl: float = 600, maxsize: int = 128):
+        """
+        Args:
+            ttl: Seconds an entry is served without refreshing
+            stale_ttl: Seconds an entry may be served while it is refreshed
+            maxsize: Most entries held at once
+        """
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.maxsize = maxsize
+        # key -> [value, fresh_until, stale_until, refreshing], oldest use first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """Return the cached value for key, computing it with compute() if needed"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                value, fresh_until, stale_until, refreshing = entry
+                if now < fresh_until:
+                    return value
+                if now < stale_until:
+                    if not refreshing:
+                        entry[3] = True
+                        threading.Thread(
+                            target=self._refresh, args=(key, compute),
+                            name=f"swr-refresh-{key}", daemon=True
+                        ).start()
+                    return value
+
+        value = compute()
+        self._store(key, value)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one entry, or every entry when key is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _store(self, key, value):
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = [value, now + self.ttl, now + self.stale_ttl, False]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _refresh(self, key, compute):
+        try:
+            self._store(key, compute())
+        except Exception as e:
+            logger.warning(f"Background refresh of {key!r} failed: {e}")
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry[3] = False
+
+
+def swr_cached(ttl: float = 60, stale_ttl: float = 600, maxsize: int = 128):
+    """
+    Decorator caching a function's return value with stale-while-revalidate
+
+    The wrapped function may be recomputed on a background thread, so it must
+    not depend on the Flask request/app context. Positional arguments form the
+    cache key; the underlying cache is exposed as ``wrapper.cache``.
+    """
+    def decorator(func):
+        cache = SWRCache(ttl=ttl, stale_ttl=stale_ttl, maxsize=maxsize)
+
+        @wraps(func)
+        def wrapper(*args):
+            return cache.get((func.__name__,) + args, lambda: func(*args))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
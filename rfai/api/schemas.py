@@ -0,0 +1,82 @@
+"""
+API Schemas
+Typed request bodies and stored documents decoded (and validated) in a single
+msgspec pass. Decoders are built once at import time and reused for every request.
+"""
+
+from typing import Annotated, Dict, List, Optional, Union
+
+import msgspec
+
+
+class GeneratePlanRequest(msgspec.Struct):
+    """Body of POST /api/plans/generate"""
+    topic: str
+    user_context: Dict = {}
+
+
+class ReviewCardRequest(msgspec.Struct):
+    """Body of POST /api/srs/review"""
+    card_id: str
+    quality: Annotated[int, msgspec.Meta(ge=0, le=5)]
+
+
+class RateContentRequest(msgspec.Struct):
+    """Body of POST /api/content/rate"""
+    content_id: str
+    rating: Annotated[int, msgspec.Meta(ge=1, le=5)]
+    tags: List[str] = []
+    time_spent_seconds: int = 0
+
+
+class BulkRatingsRequest(msgspec.Struct):
+    """Body of POST /api/ratings/bulk (a bare list of ratings is accepted too)"""
+    ratings: List[RateContentRequest]
+
+
+class MovieReviewRequest(msgspec.Struct):
+    """Body of POST /api/movie/post-review"""
+    movie_id: str
+    answers: Dict = {}
+
+
+class FetchArgs(msgspec.Struct):
+    """Query string of GET /api/fetch/youtube/*, /api/fetch/papers and /api/fetch/movies"""
+    max_results: Annotated[int, msgspec.Meta(ge=1, le=50)] = 10
+
+
+class TrainingDatasetArgs(msgspec.Struct):
+    """Query string of GET /api/data/training-dataset"""
+    days: Annotated[int, msgspec.Meta(ge=1, le=365)] = 7
+
+
+class PlanWeek(msgspec.Struct):
+    """Outline of one week of a stored plan; days are left undecoded"""
+    theme: Optional[str] = None
+    days: List[msgspec.Raw] = []
+
+
+class PlanOutline(msgspec.Struct):
+    """Structural subset of learning_plans.plan_json used for navigation"""
+    weeks: List[PlanWeek] = []
+
+
+# Compiled decoders, one per schema
+generate_plan_decoder = msgspec.json.Decoder(GeneratePlanRequest)
+review_card_decoder = msgspec.json.Decoder(ReviewCardRequest)
+rate_content_decoder = msgspec.json.Decoder(RateContentRequest)
+bulk_ratings_decoder = msgspec.json.Decoder(Union[List[RateContentRequest], BulkRatingsRequest])
+movie_review_decoder = msgspec.json.Decoder(MovieReviewRequest)
+plan_outline_decoder = msgspec.json.Decoder(PlanOutline)
+json_decoder = msgspec.json.Decoder()
+
+# Raised for malformed JSON as well as schema violations
+RequestValidationError = msgspec.DecodeError
+
+
+def parse_query(args, schema):
+    """
+    Convert a request's query arguments into schema, coercing strings to the
+    annotated types (first value wins for repeated keys; unknown keys ignored)
+    """
+    return msgspec.convert(args.to_dict(), schema, strict=False)
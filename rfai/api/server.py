@@ -4,32 +4,388 @@ Extends the existing Learning_AI app with full RFAI features
 """
 
 import sys
+import gzip
 import json
-import uuid
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, abort, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from gunicorn.app.base import BaseApplication
+    HAS_GUNICORN = True
+except ImportError:  # Not installed, or not supported (Windows)
+    HAS_GUNICORN = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Import RFAI components
-from rfai.ai.plan_generator import PlanGeneratorAI
-from rfai.ai.pace_learner_rl import PaceLearnerRL
-from rfai.ai.content_digest_ai import ContentDigestAI
-from rfai.ai.srs_engine import AdaptiveSRS
-from rfai.ai.schedule_optimizer import ScheduleOptimizerAI
-from rfai.ai.time_block_content import TimeBlockContentManager
-from rfai.ai.block_access_manager import BlockAccessManager
+# Import RFAI components (heavier AI components are imported lazily below)
 from rfai.ai.session_manager import SessionManager
 from rfai.ai.data_collector import DataCollector
-from database.init_db import get_db_connection, init_database
+from rfai.api.cache import swr_cached
+from rfai.api.batch_writer import BatchWriter
+from rfai.api import schemas
+from database.init_db import get_pooled_connection, init_database, new_id
 
 logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    def dumps_json(obj):
+        """Serialize obj to a JSON string for a TEXT column"""
+        # Non-string keys are stringified, as json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    encode_json = orjson.dumps
+    loads_json = orjson.loads
+    
+    class OrjsonProvider(DefaultJSONProvider):
+        """
+        jsonify()/request.get_json() backed by orjson
+        
+        Output matches the default provider except that keys keep insertion
+        order; dates still go through Flask's default() (HTTP date format).
+        """
+        
+        OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        
+        def _encode(self, obj, indent=False):
+            option = self.OPTIONS | orjson.OPT_INDENT_2 if indent else self.OPTIONS
+            return orjson.dumps(obj, default=self.default, option=option)
+        
+        def dumps(self, obj, **kwargs):
+            return self._encode(obj, indent=bool(kwargs.get('indent'))).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+        
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            return self._app.response_class(self._encode(obj, indent) + b'\n', mimetype=self.mimetype)
+else:
+    dumps_json = json.dumps
+    loads_json = json.loads
+    
+    def encode_json(obj):
+        """Serialize obj to UTF-8 JSON bytes"""
+        return json.dumps(obj).encode()
+
+MOVIE_REVIEW_TAGS_JSON = dumps_json(['movie_review', 'post_viewing'])
+
+# Map content type requests to the block type that allows them
+CONTENT_TO_BLOCK_MAP = {
+    'science_youtube': 'science_youtube_and_papers',
+    'science_papers': 'science_youtube_and_papers',
+    'self_help_youtube': 'self_help_youtube',
+    'movies': 'artistic_movies'
+}
+
+# Content recommendations per block type, matched in order by keyword
+BLOCK_CONTENT_BUILDERS = (
+    ('science', lambda manager: {
+        'youtube': manager.get_youtube_content(),
+        'papers': manager.get_papers_content()
+    }),
+    ('self_help', lambda manager: {
+        'youtube': manager.get_youtube_content()
+    }),
+    ('movie', lambda manager: {
+        'movies': manager.get_movie_content()
+    }),
+)
+
+# Live listings fetched for the active block: content_type -> ((key, fetch method, max_results), ...)
+BLOCK_FETCH_PLAN = {
+    'science_youtube_and_papers': (
+        ('youtube_videos', 'fetch_science_youtube', 5),
+        ('research_papers', 'fetch_research_papers', 5),
+    ),
+    'self_help_youtube': (
+        ('youtube_videos', 'fetch_self_help_youtube', 10),
+    ),
+    'artistic_movies': (
+        ('movies', 'fetch_movies', 10),
+    ),
+}
+
+# Hot-path statements. Keeping each as one module-level string means every
+# call passes the identical SQL text, so the pooled connection's prepared
+# statement cache serves it without re-parsing.
+INSERT_RATING_SQL = """
+    INSERT INTO ratings (
+        id, content_id, rating, tags, time_spent_seconds, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_TIME_LOG_SQL = """
+    INSERT INTO time_logs (
+        id, timestamp, actual_app, page_title,
+        page_info_json, focus_state, duration_seconds
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_BLOCK_ACTIVITY_SQL = """
+    INSERT INTO block_activity_log (
+        session_id, timestamp, action, content_type,
+        page_title, attention_score
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_SESSION_CONTENT_SQL = """
+    INSERT INTO session_content_log (
+        session_id, content_id, content_type, title, metadata_json
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+INSERT_BLOCK_SESSION_SQL = """
+    INSERT INTO time_block_sessions (
+        block_name, block_type, start_time, goal_duration_minutes
+    ) VALUES (?, ?, datetime('now'), ?)
+"""
+
+LATEST_ATTENTION_SQL = """
+    SELECT session_id, timestamp, state, score, confidence,
+           trend, signals_json, capabilities_json
+    FROM attention_log
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+
+ATTENTION_HISTORY_SQL = """
+    SELECT timestamp, state, score, confidence, trend
+    FROM attention_log
+    ORDER BY timestamp DESC
+    LIMIT ? OFFSET ?
+"""
+
+SESSION_ATTENTION_HISTORY_SQL = """
+    SELECT timestamp, state, score, confidence, trend
+    FROM attention_log
+    WHERE session_id = ?
+    ORDER BY timestamp DESC
+    LIMIT ? OFFSET ?
+"""
+
+PAGE_ACTIVITY_SQL = """
+    SELECT id, timestamp, actual_app AS app_name, page_title,
+           page_info_json, focus_state, duration_seconds
+    FROM time_logs
+    ORDER BY timestamp DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Block activity (kind 0) and consumed content (kind 1) of one session in a
+# single round trip; each kind keeps its own ordering. SQLite renders every
+# row as a finished JSON object, which is streamed out as-is.
+SESSION_ACTIVITY_SQL = """
+    SELECT 0 AS kind, timestamp AS sort_key,
+           json_object('timestamp', timestamp, 'action', action,
+                       'content_type', content_type, 'page_title', page_title,
+                       'attention_score', attention_score) AS doc
+    FROM block_activity_log
+    WHERE session_id = ?1
+    UNION ALL
+    SELECT 1, id,
+           json_object('content_id', content_id, 'content_type', content_type,
+                       'title', title, 'metadata_json', metadata_json)
+    FROM session_content_log
+    WHERE session_id = ?1
+    ORDER BY kind, sort_key
+"""
+# Both logs are append-only, so per-session row counts and newest ids change
+# whenever the activity payload does (answered from the session_id indexes)
+SESSION_ACTIVITY_VERSION_SQL = """
+    SELECT (SELECT COUNT(*) || '.' || IFNULL(MAX(id), 0)
+            FROM block_activity_log WHERE session_id = ?1) || '-' ||
+           (SELECT COUNT(*) || '.' || IFNULL(MAX(id), 0)
+            FROM session_content_log WHERE session_id = ?1)
+"""
+
+# Per-state aggregates over exactly the window returned by a history query
+# (takes the same parameters as the query it wraps)
+_ATTENTION_STATS_TEMPLATE = """
+    SELECT state,
+           COUNT(*) AS samples,
+           COUNT(score) AS scored,
+           SUM(score) AS total_score,
+           MAX(score) AS max_score,
+           MIN(score) AS min_score
+    FROM ({window})
+    GROUP BY state
+"""
+ATTENTION_STATS_SQL = _ATTENTION_STATS_TEMPLATE.format(window=ATTENTION_HISTORY_SQL)
+SESSION_ATTENTION_STATS_SQL = _ATTENTION_STATS_TEMPLATE.format(window=SESSION_ATTENTION_HISTORY_SQL)
+
+
+def day_bounds(day):
+    """
+    Half-open [start, end) bounds of a calendar day for timestamp range scans
+    
+    Unlike DATE(timestamp) = ?, a range on the raw column can use the
+    timestamp indexes. Bare dates are used as bounds so that both
+    'YYYY-MM-DD HH:MM:SS' and ISO 'YYYY-MM-DDTHH:MM:SS' values compare correctly.
+    """
+    return day.isoformat(), (day + timedelta(days=1)).isoformat()
+
+
+def attention_statistics(cursor):
+    """
+    Combine per-state rows from ATTENTION_STATS_SQL into summary statistics
+    
+    SQLite does the per-row work; only one row per state reaches Python.
+    """
+    total_score = 0.0
+    scored = 0
+    max_score = min_score = None
+    state_distribution = {}
+    for row in cursor:
+        state_distribution[row['state']] = row['samples']
+        if row['scored']:
+            total_score += row['total_score']
+            scored += row['scored']
+            max_score = row['max_score'] if max_score is None else max(max_score, row['max_score'])
+            min_score = row['min_score'] if min_score is None else min(min_score, row['min_score'])
+    
+    return {
+        'average_score': round(total_score / scored, 2) if scored else None,
+        'max_score': max_score,
+        'min_score': min_score,
+        'state_distribution': state_distribution,
+        'total_samples': sum(state_distribution.values())
+    }
+
+
+def parse_json_body():
+    """
+    Decode the request's JSON body (an empty body decodes to {})
+    
+    The raw bytes are read once without being cached on the request and
+    decoded with the module's JSON backend rather than request.json.
+    """
+    raw = request.get_data(cache=False)
+    return loads_json(raw) if raw else {}
+
+
+def etag_json_response(body, etag=None, max_age=None):
+    """
+    Serve pre-encoded JSON bytes with an ETag, answering 304 when it matches
+    
+    Args:
+        body: Encoded JSON payload
+        etag: Precomputed entity tag (hashed from body if omitted)
+        max_age: Seconds clients may reuse the response without revalidating
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag or hashlib.sha1(body).hexdigest())
+    if max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+def stream_json_list(key, cursor, conn, transform=None, extra=None, count_key=None):
+    """
+    Stream an executed cursor's rows as {"<key>": [...]} without building the list
+    
+    Rows are serialized one at a time as the client reads them, and the
+    connection is released once the stream finishes (or the client disconnects).
+    
+    Args:
+        extra: Additional top-level fields written before the list
+        count_key: If given, the number of streamed rows is added under this key
+    """
+    def generate():
+        try:
+            head = b'{'
+            for name, value in (extra or {}).items():
+                head += encode_json(name) + b':' + encode_json(value) + b','
+            yield head + encode_json(key) + b':['
+            separator = b''
+            count = 0
+            for row in cursor:
+                item = dict(row)
+                if transform is not None:
+                    transform(item)
+                yield separator + encode_json(item)
+                separator = b','
+                count += 1
+            if count_key is not None:
+                yield b'],' + encode_json(count_key) + b':' + encode_json(count) + b'}'
+            else:
+                yield b']}'
+        finally:
+            conn.close()
+    
+    return Response(generate(), mimetype='application/json')
+
+
+class RFAIFlask(Flask):
+    """Flask app whose AI components are imported and built on first access"""
+    
+    if HAS_ORJSON:
+        json_provider_class = OrjsonProvider
+    
+    @cached_property
+    def plan_generator(self):
+        from rfai.ai.plan_generator import PlanGeneratorAI
+        return PlanGeneratorAI()
+    
+    @cached_property
+    def content_digester(self):
+        from rfai.ai.content_digest_ai import ContentDigestAI
+        return ContentDigestAI()
+    
+    @cached_property
+    def time_block_manager(self):
+        """Time-block aware content"""
+        from rfai.ai.time_block_content import TimeBlockContentManager
+        return TimeBlockContentManager()
+    
+    @cached_property
+    def content_fetcher(self):
+        """Content fetcher for real recommendations"""
+        from rfai.ai.content_fetcher import ContentFetcher
+        logger.info("Content fetcher initialized")
+        return ContentFetcher()
+    
+    @cached_property
+    def discovery(self):
+        """Multi-source discovery, shared so API clients are set up once"""
+        from rfai.ai.multi_source_discovery import MultiSourceDiscovery
+        return MultiSourceDiscovery()
+    
+    @cached_property
+    def progress_tester(self):
+        """Progress tester for quizzes"""
+        from rfai.ai.progress_tester import ProgressTester
+        logger.info("Progress tester initialized")
+        return ProgressTester(self.config['RFAI_DB_PATH'])
+    
+    @cached_property
+    def fetch_executor(self):
+        """Shared thread pool for overlapping blocking content-fetch calls"""
+        return ThreadPoolExecutor(max_workers=4, thread_name_prefix='rfai-fetch')
+
 
 def create_app():
     """Create and configure the Flask app"""
@@ -41,58 +397,119 @@ def create_app():
         # Never fail app startup because of dotenv parsing
         pass
 
-    app = Flask(__name__)
+    app = RFAIFlask(__name__)
     CORS(app)
     
     # Configuration
     app.config['RFAI_DATA_DIR'] = Path.home() / ".rfai"
     app.config['RFAI_DB_PATH'] = app.config['RFAI_DATA_DIR'] / "data" / "rfai.db"
+    app.config['RFAI_DB_PATH_STR'] = str(app.config['RFAI_DB_PATH'])
+    app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024  # Bodies are small JSON documents
+    
+    # Per-thread pooled connections bound to the database path once;
+    # conn.close() hands a connection back to the pool rather than closing it
+    get_db = partial(get_pooled_connection, app.config['RFAI_DB_PATH_STR'])
     
     # Ensure data directory exists
     app.config['RFAI_DATA_DIR'].mkdir(parents=True, exist_ok=True)
     (app.config['RFAI_DATA_DIR'] / "data").mkdir(parents=True, exist_ok=True)
     
-    # Initialize database if needed
-    if not app.config['RFAI_DB_PATH'].exists():
-        logger.info("Initializing database...")
-        init_database(app.config['RFAI_DB_PATH'])
+    # Initialize the database. The schema is idempotent, so running it against
+    # an existing file only adds tables and indexes introduced since it was created.
+    logger.info("Initializing database...")
+    init_database(app.config['RFAI_DB_PATH'])
     
-    # Initialize AI components
-    app.plan_generator = PlanGeneratorAI()
+    # Initialize AI components (plan_generator, content_digester,
+    # time_block_manager, content_fetcher and progress_tester are built
+    # lazily by RFAIFlask on first access)
     app.pace_learner = None  # Initialized on demand
-    app.content_digester = ContentDigestAI()
     app.srs_engine = None  # Initialized on demand
     app.schedule_optimizer = None  # Initialized on demand
     app.content_scheduler = None  # Initialized on demand
-    app.time_block_manager = TimeBlockContentManager()  # Time-block aware content
     app.session_manager = SessionManager(app.config['RFAI_DB_PATH'])  # Session tracking
     app.data_collector = DataCollector(app.config['RFAI_DB_PATH'])  # Data collection for AI
+    app.activity_writer = BatchWriter(get_db)  # Batched activity-log inserts
     
-    # Initialize content fetcher for real recommendations
-    from rfai.ai.content_fetcher import ContentFetcher
-    app.content_fetcher = ContentFetcher()
-    logger.info("Content fetcher initialized")
+    logger.info("RFAI API Server initialized")
     
-    # Initialize progress tester for quizzes
-    from rfai.ai.progress_tester import ProgressTester
-    app.progress_tester = ProgressTester(app.config['RFAI_DB_PATH'])
-    logger.info("Progress tester initialized")
+    @app.before_request
+    def reject_oversized_body():
+        """Refuse declared oversized bodies before a handler starts reading"""
+        if (request.content_length is not None
+                and request.content_length > app.config['MAX_CONTENT_LENGTH']):
+            abort(413)
+    
+    # Dashboard pages are kept in memory, pre-compressed, and only re-read
+    # when their mtime changes
+    static_dir = Path(__file__).parent.parent / 'ui' / 'static'
+    page_cache = {}
+    
+    def load_static_page(filename):
+        """Return the cached encodings of a static page, or None if it doesn't exist"""
+        path = static_dir / filename
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            page_cache.pop(filename, None)
+            return None
+        
+        cached = page_cache.get(filename)
+        if cached is None or cached[0] != mtime:
+            raw = path.read_bytes()
+            encodings = {'identity': raw, 'gzip': gzip.compress(raw, 9)}
+            if HAS_BROTLI:
+                encodings['br'] = brotli.compress(raw, quality=11)
+            page = {
+                'encodings': encodings,
+                'etag': hashlib.sha1(raw).hexdigest(),
+                'last_modified': datetime.fromtimestamp(mtime / 1e9, tz=timezone.utc),
+            }
+            cached = (mtime, page)
+            page_cache[filename] = cached
+        return cached[1]
     
-    logger.info("RFAI API Server initialized")
+    def html_response(page):
+        """
+        Serve a cached page in the best encoding the client accepts
+        
+        Responses carry an ETag and Last-Modified, so a browser revalidating
+        an unchanged dashboard gets an empty 304 instead of the page.
+        """
+        encodings = page['encodings']
+        accepted = request.accept_encodings
+        for encoding in ('br', 'gzip'):
+            if encoding in encodings and accepted[encoding] > 0:
+                break
+        else:
+            encoding = 'identity'
+        
+        response = Response(encodings[encoding], content_type='text/html; charset=utf-8')
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        # Each encoding is a different representation, so it gets its own ETag
+        response.set_etag(f"{page['etag']}-{encoding}")
+        response.last_modified = page['last_modified']
+        response.cache_control.no_cache = True  # Always revalidate
+        return response.make_conditional(request)
+    
+    # Compress the dashboards once at startup rather than on the first request
+    for filename in ('dashboard_enhanced.html', 'index.html'):
+        load_static_page(filename)
 
     @app.route('/', methods=['GET'])
     def home():
         """Serve the RFAI dashboard"""
         try:
             # Try enhanced dashboard first
-            enhanced_path = Path(__file__).parent.parent / 'ui' / 'static' / 'dashboard_enhanced.html'
-            if enhanced_path.exists():
-                return enhanced_path.read_text(encoding='utf-8')
+            page = load_static_page('dashboard_enhanced.html')
+            if page is not None:
+                return html_response(page)
             
             # Fallback to original dashboard
-            dashboard_path = Path(__file__).parent.parent / 'ui' / 'static' / 'index.html'
-            if dashboard_path.exists():
-                return dashboard_path.read_text(encoding='utf-8')
+            page = load_static_page('index.html')
+            if page is not None:
+                return html_response(page)
             else:
                 # Fallback if dashboard file doesn't exist
                 return (
@@ -114,9 +531,9 @@ def create_app():
     def dashboard_enhanced():
         """Serve the enhanced 3-hour plan dashboard"""
         try:
-            dashboard_path = Path(__file__).parent.parent / 'ui' / 'static' / 'dashboard_enhanced.html'
-            if dashboard_path.exists():
-                return dashboard_path.read_text(encoding='utf-8')
+            page = load_static_page('dashboard_enhanced.html')
+            if page is not None:
+                return html_response(page)
             else:
                 return jsonify({'error': 'Enhanced dashboard not found'}), 404
         except Exception as e:
@@ -131,9 +548,9 @@ def create_app():
     def generate_plan():
         """Generate a new learning plan"""
         try:
-            data = request.json
-            topic = data.get('topic')
-            user_context = data.get('user_context', {})
+            body = schemas.generate_plan_decoder.decode(request.get_data(cache=False))
+            topic = body.topic
+            user_context = body.user_context
             
             if not topic:
                 return jsonify({'error': 'Topic is required'}), 400
@@ -144,7 +561,7 @@ def create_app():
             plan = app.plan_generator.generate_plan(topic, user_context)
             
             # Save to database
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             try:
                 cursor = conn.cursor()
                 
@@ -161,13 +578,14 @@ def create_app():
                     1,
                     1,
                     'active',
-                    json.dumps(plan)
+                    dumps_json(plan)
                 ))
                 
                 conn.commit()
             finally:
                 conn.close()
             
+            build_status.cache.invalidate()  # Plan count changed
             logger.info(f"Plan saved: {plan['plan_id']}")
             
             return jsonify({
@@ -181,6 +599,8 @@ def create_app():
                 }
             }), 201
             
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error generating plan: {e}")
             return jsonify({'error': str(e)}), 500
@@ -189,7 +609,7 @@ def create_app():
     def get_plan(plan_id):
         """Get a specific learning plan"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -204,7 +624,7 @@ def create_app():
             
             plan = dict(plan_row)
             if plan['plan_json']:
-                plan['plan_data'] = json.loads(plan['plan_json'])
+                plan['plan_data'] = schemas.json_decoder.decode(plan['plan_json'])
             
             return jsonify(plan)
             
@@ -216,20 +636,21 @@ def create_app():
     def list_plans():
         """List all learning plans"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT id, topic, estimated_duration_weeks, current_week,
-                       current_day, status, created_at
-                FROM learning_plans
-                ORDER BY created_at DESC
-            """)
-            
-            plans = [dict(row) for row in cursor.fetchall()]
-            conn.close()
+            conn = get_db()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, topic, estimated_duration_weeks, current_week,
+                           current_day, status, created_at
+                    FROM learning_plans
+                    ORDER BY created_at DESC
+                """)
+            except Exception:
+                conn.close()
+                raise
             
-            return jsonify({'plans': plans})
+            # Unbounded list: stream rows instead of building it in memory
+            return stream_json_list('plans', cursor, conn)
             
         except Exception as e:
             logger.error(f"Error listing plans: {e}")
@@ -239,7 +660,7 @@ def create_app():
     def get_current_day(plan_id):
         """Get the current day for a plan"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             # Get plan
@@ -253,24 +674,25 @@ def create_app():
                 conn.close()
                 return jsonify({'error': 'Plan not found'}), 404
             
-            plan_data = json.loads(plan_row['plan_json'])
+            # Only the week outline is decoded; the day itself is decoded below
+            plan_outline = schemas.plan_outline_decoder.decode(plan_row['plan_json'])
             current_week = plan_row['current_week']
             current_day = plan_row['current_day']
             
             conn.close()
             
             # Find current day in plan
-            if current_week <= len(plan_data['weeks']):
-                week = plan_data['weeks'][current_week - 1]
-                if current_day <= len(week['days']):
-                    day = week['days'][current_day - 1]
+            if current_week <= len(plan_outline.weeks):
+                week = plan_outline.weeks[current_week - 1]
+                if current_day <= len(week.days):
+                    day = schemas.json_decoder.decode(week.days[current_day - 1])
                     
                     return jsonify({
                         'plan_id': plan_id,
                         'week': current_week,
                         'day': current_day,
                         'day_data': day,
-                        'week_theme': week['theme']
+                        'week_theme': week.theme
                     })
             
             return jsonify({'error': 'Current day not found in plan'}), 404
@@ -283,7 +705,7 @@ def create_app():
     def advance_plan(plan_id):
         """Move to next day in plan"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             # Get current position
@@ -299,10 +721,10 @@ def create_app():
             
             current_week = row['current_week']
             current_day = row['current_day']
-            plan_data = json.loads(row['plan_json'])
+            plan_outline = schemas.plan_outline_decoder.decode(row['plan_json'])
             
             # Calculate next position
-            days_in_week = len(plan_data['weeks'][current_week - 1]['days'])
+            days_in_week = len(plan_outline.weeks[current_week - 1].days)
             
             if current_day < days_in_week:
                 # Move to next day in same week
@@ -342,26 +764,26 @@ def create_app():
         """List or create goals"""
         if request.method == 'GET':
             try:
-                conn = get_db_connection(app.config['RFAI_DB_PATH'])
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT * FROM goals WHERE status = 'active'
-                    ORDER BY created_at DESC
-                """)
-                
-                goals = [dict(row) for row in cursor.fetchall()]
+                conn = get_db()
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute("""
+                        SELECT * FROM goals WHERE status = 'active'
+                        ORDER BY created_at DESC
+                    """)
+                except Exception:
+                    conn.close()
+                    raise
                 
-                # Parse JSON fields
-                for goal in goals:
+                def parse_goal(goal):
+                    # Parse JSON fields
                     if goal['subtopics']:
-                        goal['subtopics'] = json.loads(goal['subtopics'])
+                        goal['subtopics'] = loads_json(goal['subtopics'])
                     if goal['resources']:
-                        goal['resources'] = json.loads(goal['resources'])
-                
-                conn.close()
+                        goal['resources'] = loads_json(goal['resources'])
                 
-                return jsonify({'goals': goals})
+                # Unbounded list: stream rows instead of building it in memory
+                return stream_json_list('goals', cursor, conn, transform=parse_goal)
                 
             except Exception as e:
                 logger.error(f"Error listing goals: {e}")
@@ -369,10 +791,10 @@ def create_app():
         
         else:  # POST
             try:
-                data = request.json
-                goal_id = str(uuid.uuid4())
+                data = parse_json_body()
+                goal_id = new_id()
                 
-                conn = get_db_connection(app.config['RFAI_DB_PATH'])
+                conn = get_db()
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -385,14 +807,16 @@ def create_app():
                     data['name'],
                     data.get('timeline_months', 6),
                     data.get('target_hours', 180),
-                    json.dumps(data.get('subtopics', [])),
-                    json.dumps(data.get('resources', {})),
+                    dumps_json(data.get('subtopics', [])),
+                    dumps_json(data.get('resources', {})),
                     'active'
                 ))
                 
                 conn.commit()
                 conn.close()
                 
+                build_status.cache.invalidate()  # Goal count changed
+                
                 return jsonify({
                     'success': True,
                     'goal_id': goal_id
@@ -410,45 +834,54 @@ def create_app():
     def get_today_activity():
         """Get today's activity logs"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             today = datetime.now().date()
+            day_start, day_end = day_bounds(today)
             
+            # Let SQLite aggregate the summary in a single pass
+            cursor.execute("""
+                SELECT COALESCE(SUM(duration_seconds), 0) AS total_time,
+                       COALESCE(SUM(CASE WHEN focus_state = 'FOCUSED'
+                                         THEN duration_seconds ELSE 0 END), 0) AS focus_time
+                FROM time_logs
+                WHERE timestamp >= ? AND timestamp < ?
+            """, (day_start, day_end))
+            
+            summary = cursor.fetchone()
+            total_time = summary['total_time']
+            focus_time = summary['focus_time']
+            
+            # Only fetch the rows the dashboard previews (last 50)
             cursor.execute("""
                 SELECT * FROM time_logs
-                WHERE DATE(timestamp) = ?
+                WHERE timestamp >= ? AND timestamp < ?
                 ORDER BY timestamp DESC
-            """, (today,))
+                LIMIT 50
+            """, (day_start, day_end))
             
-            logs = [dict(row) for row in cursor.fetchall()]
+            logs = [dict(row) for row in cursor]
             
             # Get focus states
             cursor.execute("""
                 SELECT * FROM focus_states
-                WHERE DATE(timestamp) = ?
+                WHERE timestamp >= ? AND timestamp < ?
                 ORDER BY timestamp DESC
-            """, (today,))
+                LIMIT 50
+            """, (day_start, day_end))
             
-            focus_states = [dict(row) for row in cursor.fetchall()]
+            focus_states = [dict(row) for row in cursor]
             
             conn.close()
             
-            # Calculate summary
-            total_time = sum(log.get('duration_seconds', 0) for log in logs)
-            focus_time = sum(
-                log.get('duration_seconds', 0) 
-                for log in logs 
-                if log.get('focus_state') == 'FOCUSED'
-            )
-            
             return jsonify({
                 'date': str(today),
                 'total_time_seconds': total_time,
                 'focus_time_seconds': focus_time,
                 'focus_percentage': (focus_time / total_time * 100) if total_time > 0 else 0,
-                'logs': logs[:50],  # Return last 50
-                'focus_states': focus_states[:50]
+                'logs': logs,
+                'focus_states': focus_states
             })
             
         except Exception as e:
@@ -459,7 +892,7 @@ def create_app():
     def get_current_focus():
         """Get current focus state"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -474,7 +907,7 @@ def create_app():
             if state:
                 state_dict = dict(state)
                 if state_dict.get('signal_breakdown'):
-                    state_dict['signal_breakdown'] = json.loads(state_dict['signal_breakdown'])
+                    state_dict['signal_breakdown'] = loads_json(state_dict['signal_breakdown'])
                 return jsonify(state_dict)
             else:
                 return jsonify({
@@ -498,7 +931,8 @@ def create_app():
             max_cards = request.args.get('max', 20, type=int)
             
             if app.srs_engine is None:
-                app.srs_engine = AdaptiveSRS(str(app.config['RFAI_DB_PATH']))
+                from rfai.ai.srs_engine import AdaptiveSRS
+                app.srs_engine = AdaptiveSRS(app.config['RFAI_DB_PATH_STR'])
             
             cards = app.srs_engine.get_due_cards(max_cards=max_cards)
             
@@ -515,20 +949,21 @@ def create_app():
     def review_card():
         """Submit a card review"""
         try:
-            data = request.json
-            card_id = data.get('card_id')
-            quality = data.get('quality')  # 0-5
+            body = schemas.review_card_decoder.decode(request.get_data(cache=False))
             
             if app.srs_engine is None:
-                app.srs_engine = AdaptiveSRS(str(app.config['RFAI_DB_PATH']))
+                from rfai.ai.srs_engine import AdaptiveSRS
+                app.srs_engine = AdaptiveSRS(app.config['RFAI_DB_PATH_STR'])
             
-            result = app.srs_engine.review_card(card_id, quality)
+            result = app.srs_engine.review_card(body.card_id, body.quality)
             
             return jsonify({
                 'success': True,
                 'next_review': result.get('next_review_date')
             })
             
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error reviewing card: {e}")
             return jsonify({'error': str(e)}), 500
@@ -542,7 +977,8 @@ def create_app():
         """Run weekly pace adjustment"""
         try:
             if app.pace_learner is None:
-                app.pace_learner = PaceLearnerRL(str(app.config['RFAI_DB_PATH']))
+                from rfai.ai.pace_learner_rl import PaceLearnerRL
+                app.pace_learner = PaceLearnerRL(app.config['RFAI_DB_PATH_STR'])
             
             adjustment = app.pace_learner.weekly_adjustment()
             
@@ -561,44 +997,48 @@ def create_app():
     # SYSTEM STATUS ENDPOINTS
     # ============================================================================
     
-    @app.route('/api/status', methods=['GET'])
-    def get_status():
-        """Get system status"""
+    @swr_cached(ttl=5, stale_ttl=60)
+    def build_status():
+        """Build the /api/status payload (cached; refreshed in the background)"""
+        conn = get_db()
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
             cursor = conn.cursor()
             
             # Get daemon status
             cursor.execute("SELECT * FROM daemon_status")
-            daemons = [dict(row) for row in cursor.fetchall()]
+            daemons = [dict(row) for row in cursor]
             
             # Get config
             cursor.execute("SELECT * FROM system_config")
-            config = {row['key']: row['value'] for row in cursor.fetchall()}
-            
-            # Get counts
-            cursor.execute("SELECT COUNT(*) as count FROM learning_plans")
-            plan_count = cursor.fetchone()['count']
-            
-            cursor.execute("SELECT COUNT(*) as count FROM goals")
-            goal_count = cursor.fetchone()['count']
-            
-            cursor.execute("SELECT COUNT(*) as count FROM flashcards")
-            card_count = cursor.fetchone()['count']
+            config = {row['key']: row['value'] for row in cursor}
             
+            # Get counts in a single statement
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM learning_plans),
+                       (SELECT COUNT(*) FROM goals),
+                       (SELECT COUNT(*) FROM flashcards)
+            """)
+            plan_count, goal_count, card_count = cursor.fetchone()
+        finally:
             conn.close()
-            
-            return jsonify({
-                'system': 'RFAI',
-                'version': config.get('system_version', '1.0.0'),
-                'daemons': daemons,
-                'stats': {
-                    'plans': plan_count,
-                    'goals': goal_count,
-                    'flashcards': card_count
-                },
-                'config': config
-            })
+        
+        return {
+            'system': 'RFAI',
+            'version': config.get('system_version', '1.0.0'),
+            'daemons': daemons,
+            'stats': {
+                'plans': plan_count,
+                'goals': goal_count,
+                'flashcards': card_count
+            },
+            'config': config
+        }
+    
+    @app.route('/api/status', methods=['GET'])
+    def get_status():
+        """Get system status"""
+        try:
+            return jsonify(build_status())
             
         except Exception as e:
             logger.error(f"Error getting status: {e}")
@@ -612,7 +1052,7 @@ def create_app():
     def get_today_timetable():
         """Get today's timetable slots"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -624,7 +1064,7 @@ def create_app():
                 LIMIT 10
             """)
             
-            slots = [dict(row) for row in cursor.fetchall()]
+            slots = [dict(row) for row in cursor]
             conn.close()
             
             return jsonify({
@@ -640,13 +1080,11 @@ def create_app():
     def discover_content():
         """Search for content by topic"""
         try:
-            data = request.json
+            data = parse_json_body()
             topic = data.get('topic', 'machine learning')
             
             try:
-                from rfai.ai.multi_source_discovery import MultiSourceDiscovery
-                discovery = MultiSourceDiscovery()
-                results = discovery.discover(topic, max_results=10)
+                results = app.discovery.get_mixed_recommendations(topic, total=10)
                 
                 return jsonify({
                     'topic': topic,
@@ -670,21 +1108,26 @@ def create_app():
     # CONTENT SCHEDULER ENDPOINTS (3-HOUR DAILY PLAN)
     # ============================================================================
     
+    @swr_cached(ttl=60, stale_ttl=600)
+    def build_daily_schedule():
+        """Build the /api/schedule/daily payload (cached; refreshed in the background)"""
+        if app.content_scheduler is None:
+            from rfai.ai.content_scheduler import ContentScheduler
+            app.content_scheduler = ContentScheduler()
+        
+        schedule = app.content_scheduler.generate_daily_schedule()
+        
+        return {
+            'success': True,
+            'schedule': schedule,
+            'summary': app.content_scheduler.get_schedule_summary(schedule)
+        }
+    
     @app.route('/api/schedule/daily', methods=['GET'])
     def get_daily_schedule():
         """Get today's content schedule (3-hour plan)"""
         try:
-            if app.content_scheduler is None:
-                from rfai.ai.content_scheduler import ContentScheduler
-                app.content_scheduler = ContentScheduler()
-            
-            schedule = app.content_scheduler.generate_daily_schedule()
-            
-            return jsonify({
-                'success': True,
-                'schedule': schedule,
-                'summary': app.content_scheduler.get_schedule_summary(schedule)
-            })
+            return jsonify(build_daily_schedule())
             
         except Exception as e:
             logger.error(f"Error getting daily schedule: {e}")
@@ -697,30 +1140,22 @@ def create_app():
     def rate_content():
         """Rate a piece of content"""
         try:
-            data = request.json
-            content_id = data.get('content_id')
-            rating = data.get('rating')  # 1-5
-            tags = data.get('tags', [])
-            time_spent = data.get('time_spent_seconds', 0)
+            body = schemas.rate_content_decoder.decode(request.get_data(cache=False))
             
-            if not content_id or not rating:
+            if not body.content_id:
                 return jsonify({'error': 'content_id and rating required'}), 400
             
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
-            rating_id = str(uuid.uuid4())
+            rating_id = new_id()
             
-            cursor.execute("""
-                INSERT INTO ratings (
-                    id, content_id, rating, tags, time_spent_seconds, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(INSERT_RATING_SQL, (
                 rating_id,
-                content_id,
-                rating,
-                json.dumps(tags),
-                time_spent,
+                body.content_id,
+                body.rating,
+                dumps_json(body.tags),
+                body.time_spent_seconds,
                 datetime.now().isoformat()
             ))
             
@@ -733,26 +1168,78 @@ def create_app():
                 'message': 'Rating saved successfully'
             })
             
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error rating content: {e}")
             return jsonify({'error': str(e)}), 500
     
+    @app.route('/api/ratings/bulk', methods=['POST'])
+    def rate_content_bulk():
+        """Rate several pieces of content in a single transaction"""
+        try:
+            body = schemas.bulk_ratings_decoder.decode(request.get_data(cache=False))
+            items = body if isinstance(body, list) else body.ratings
+            
+            if not items:
+                return jsonify({'error': 'a non-empty list of ratings is required'}), 400
+            
+            timestamp = datetime.now().isoformat()
+            rows = []
+            for item in items:
+                if not item.content_id:
+                    return jsonify({'error': 'content_id and rating required for every item'}), 400
+                
+                rows.append((
+                    new_id(),
+                    item.content_id,
+                    item.rating,
+                    dumps_json(item.tags),
+                    item.time_spent_seconds,
+                    timestamp
+                ))
+            
+            conn = get_db()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(INSERT_RATING_SQL, rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+            
+            return jsonify({
+                'success': True,
+                'rating_ids': [row[0] for row in rows],
+                'count': len(rows),
+                'message': 'Ratings saved successfully'
+            })
+            
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            logger.error(f"Error saving bulk ratings: {e}")
+            return jsonify({'error': str(e)}), 500
+    
     @app.route('/api/movie/post-review', methods=['POST'])
     def submit_movie_review():
         """Submit post-movie review"""
         try:
-            data = request.json
-            movie_id = data.get('movie_id')
-            answers = data.get('answers', {})
+            body = schemas.movie_review_decoder.decode(request.get_data(cache=False))
+            movie_id = body.movie_id
+            answers = body.answers
             
             if not movie_id:
                 return jsonify({'error': 'movie_id required'}), 400
             
             # Store review as a special rating with review data
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
-            rating_id = str(uuid.uuid4())
+            rating_id = new_id()
             
             cursor.execute("""
                 INSERT INTO ratings (
@@ -762,8 +1249,8 @@ def create_app():
                 rating_id,
                 movie_id,
                 5,  # Assumed completion rating
-                json.dumps(['movie_review', 'post_viewing']),
-                json.dumps({'review_answers': answers}),
+                MOVIE_REVIEW_TAGS_JSON,
+                dumps_json({'review_answers': answers}),
                 datetime.now().isoformat()
             ))
             
@@ -776,6 +1263,8 @@ def create_app():
                 'message': 'Movie review submitted successfully'
             })
             
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error submitting movie review: {e}")
             return jsonify({'error': str(e)}), 500
@@ -784,20 +1273,21 @@ def create_app():
     def get_daily_stats():
         """Get daily statistics for dashboard"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             today = datetime.now().date()
+            day_start, day_end = day_bounds(today)
             
             # Get time logs
             cursor.execute("""
-                SELECT focus_state, SUM(duration_seconds) as total_seconds
+                SELECT focus_state, TOTAL(duration_seconds) as total_seconds
                 FROM time_logs
-                WHERE DATE(timestamp) = ?
+                WHERE timestamp >= ? AND timestamp < ?
                 GROUP BY focus_state
-            """, (today,))
+            """, (day_start, day_end))
             
-            focus_breakdown = {row['focus_state']: row['total_seconds'] for row in cursor.fetchall()}
+            focus_breakdown = {row['focus_state']: row['total_seconds'] for row in cursor}
             
             # Get learning plan progress
             cursor.execute("""
@@ -817,14 +1307,14 @@ def create_app():
             total_seconds = sum(focus_breakdown.values())
             actual_hours = total_seconds / 3600.0
             
-            # Get content ratings today
+            # Count content ratings today
             cursor.execute("""
-                SELECT content_id, rating
+                SELECT COUNT(*) AS ratings_count
                 FROM ratings
-                WHERE DATE(timestamp) = ?
-            """, (today,))
+                WHERE timestamp >= ? AND timestamp < ?
+            """, (day_start, day_end))
             
-            ratings_today = [dict(row) for row in cursor.fetchall()]
+            ratings_count = cursor.fetchone()['ratings_count']
             
             conn.close()
             
@@ -838,7 +1328,7 @@ def create_app():
                     'current_day': current_day
                 },
                 'focus_breakdown': focus_breakdown,
-                'ratings_count': len(ratings_today),
+                'ratings_count': ratings_count,
                 'time_allocation': {
                     'youtube': round(focus_breakdown.get('YOUTUBE', 0) / 3600, 2),
                     'papers': round(focus_breakdown.get('PAPERS', 0) / 3600, 2),
@@ -871,19 +1361,10 @@ def create_app():
                 # Add content recommendations based on block type
                 block_type = block_info.get('content_type')
                 
-                if 'science' in block_type:
-                    result['content'] = {
-                        'youtube': app.time_block_manager.get_youtube_content(),
-                        'papers': app.time_block_manager.get_papers_content()
-                    }
-                elif 'self_help' in block_type:
-                    result['content'] = {
-                        'youtube': app.time_block_manager.get_youtube_content()
-                    }
-                elif 'movie' in block_type:
-                    result['content'] = {
-                        'movies': app.time_block_manager.get_movie_content()
-                    }
+                for keyword, build_content in BLOCK_CONTENT_BUILDERS:
+                    if keyword in block_type:
+                        result['content'] = build_content(app.time_block_manager)
+                        break
                 
                 return jsonify(result)
             else:
@@ -897,8 +1378,10 @@ def create_app():
     def get_full_schedule():
         """Get complete daily schedule with all time blocks"""
         try:
+            # Date and current/next block change, so this is re-encoded per
+            # call; unchanged schedules still revalidate to an empty 304
             schedule = app.time_block_manager.get_full_schedule()
-            return jsonify(schedule)
+            return etag_json_response(encode_json(schedule))
         except Exception as e:
             logger.error(f"Error getting full schedule: {e}")
             return jsonify({'error': str(e)}), 500
@@ -907,7 +1390,7 @@ def create_app():
     def set_manual_override():
         """Manually override current time block"""
         try:
-            data = request.json
+            data = parse_json_body()
             block_name = data.get('block_name')  # None to clear override
             
             app.time_block_manager.set_manual_override(block_name)
@@ -937,25 +1420,51 @@ def create_app():
             logger.error(f"Error clearing override: {e}")
             return jsonify({'error': str(e)}), 500
     
+    available_blocks_cache = {}  # 'body' and 'etag' once built
+    
     @app.route('/api/schedule/available-blocks', methods=['GET'])
     def get_available_blocks():
         """Get list of all available time blocks for override"""
         try:
-            schedule = app.time_block_manager.config.get('daily_schedule', {}).get('time_blocks', [])
-            blocks = [
-                {
-                    'name': block.get('name'),
-                    'content_type': block.get('content_type'),
-                    'icon': block.get('icon'),
-                    'duration_hours': block.get('duration_hours')
-                }
-                for block in schedule
-            ]
-            return jsonify({'blocks': blocks})
+            # Built from static config, so encoded and hashed only once
+            if not available_blocks_cache:
+                schedule = app.time_block_manager.config.get('daily_schedule', {}).get('time_blocks', [])
+                blocks = [
+                    {
+                        'name': block.get('name'),
+                        'content_type': block.get('content_type'),
+                        'icon': block.get('icon'),
+                        'duration_hours': block.get('duration_hours')
+                    }
+                    for block in schedule
+                ]
+                body = encode_json({'blocks': blocks})
+                available_blocks_cache['etag'] = hashlib.sha1(body).hexdigest()
+                available_blocks_cache['body'] = body
+            
+            return etag_json_response(
+                available_blocks_cache['body'], etag=available_blocks_cache['etag'], max_age=300
+            )
         except Exception as e:
             logger.error(f"Error getting available blocks: {e}")
             return jsonify({'error': str(e)}), 500
     
+    @swr_cached(ttl=300, stale_ttl=1800)
+    def fetch_content(method, max_results):
+        """
+        Call a ContentFetcher fetch method (cached; refreshed in the background)
+        
+        Cached per (method, max_results). Results are shared between requests,
+        so callers must not mutate them.
+        """
+        return getattr(app.content_fetcher, method)(max_results=max_results)
+    
+    def fetch_all_youtube(max_results_each):
+        """Fetch science and self-help videos concurrently, science first"""
+        science = app.fetch_executor.submit(fetch_content, 'fetch_science_youtube', max_results_each)
+        self_help = app.fetch_executor.submit(fetch_content, 'fetch_self_help_youtube', max_results_each)
+        return science.result() + self_help.result()
+    
     @app.route('/api/content/youtube-recommendations', methods=['GET'])
     def get_youtube_recommendations():
         """Get YouTube video recommendations"""
@@ -965,8 +1474,7 @@ def create_app():
             
             # If it's not from a specific block, fetch actual videos
             if 'All Blocks' in content.get('block', '') or not app.time_block_manager.current_block:
-                videos = app.content_fetcher.fetch_science_youtube(max_results=5)
-                videos.extend(app.content_fetcher.fetch_self_help_youtube(max_results=5))
+                videos = fetch_all_youtube(5)
                 
                 return jsonify({
                     'videos': videos,
@@ -978,12 +1486,11 @@ def create_app():
             videos = []
             block_type = content.get('type', '')
             if 'science' in block_type.lower():
-                videos = app.content_fetcher.fetch_science_youtube(max_results=10)
+                videos = fetch_content('fetch_science_youtube', 10)
             elif 'self_help' in block_type.lower():
-                videos = app.content_fetcher.fetch_self_help_youtube(max_results=10)
+                videos = fetch_content('fetch_self_help_youtube', 10)
             else:
-                videos = app.content_fetcher.fetch_science_youtube(max_results=5)
-                videos.extend(app.content_fetcher.fetch_self_help_youtube(max_results=5))
+                videos = fetch_all_youtube(5)
             
             return jsonify({
                 'videos': videos,
@@ -999,7 +1506,7 @@ def create_app():
         """Get movie recommendations for cinema block"""
         try:
             # Try to fetch actual movie data
-            movies = app.content_fetcher.fetch_movies(max_results=10)
+            movies = fetch_content('fetch_movies', 10)
             
             # If no movies from fetcher, get from content manager
             if not movies:
@@ -1025,7 +1532,7 @@ def create_app():
         """Get research paper recommendations"""
         try:
             # Fetch papers from ArXiv (or get sample papers as fallback)
-            papers = app.content_fetcher.fetch_research_papers(max_results=10)
+            papers = fetch_content('fetch_research_papers', 10)
             
             # Also get the metadata from time block manager
             metadata = app.time_block_manager.get_papers_content()
@@ -1049,17 +1556,11 @@ def create_app():
     def get_current_attention():
         """Get current attention score and state"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
             # Get latest attention log
-            cursor.execute("""
-                SELECT session_id, timestamp, state, score, confidence,
-                       trend, signals_json, capabilities_json
-                FROM attention_log
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """)
+            cursor.execute(LATEST_ATTENTION_SQL)
             
             row = cursor.fetchone()
             conn.close()
@@ -1072,8 +1573,8 @@ def create_app():
                     'score': row['score'],
                     'confidence': row['confidence'],
                     'trend': row['trend'],
-                    'signals': json.loads(row['signals_json']),
-                    'capabilities': json.loads(row['capabilities_json'])
+                    'signals': loads_json(row['signals_json']),
+                    'capabilities': loads_json(row['capabilities_json'])
                 })
             else:
                 return jsonify({'error': 'No attention data available'}), 404
@@ -1087,53 +1588,33 @@ def create_app():
         """Get attention history for session or time range"""
         try:
             limit = request.args.get('limit', 100, type=int)
+            offset = request.args.get('offset', 0, type=int)
             session_id = request.args.get('session_id')
             
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
-            cursor = conn.cursor()
-            
             if session_id:
-                cursor.execute("""
-                    SELECT timestamp, state, score, confidence, trend
-                    FROM attention_log
-                    WHERE session_id = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """, (session_id, limit))
+                history_sql, stats_sql = SESSION_ATTENTION_HISTORY_SQL, SESSION_ATTENTION_STATS_SQL
+                params = (session_id, limit, offset)
             else:
-                cursor.execute("""
-                    SELECT timestamp, state, score, confidence, trend
-                    FROM attention_log
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """, (limit,))
+                history_sql, stats_sql = ATTENTION_HISTORY_SQL, ATTENTION_STATS_SQL
+                params = (limit, offset)
             
-            records = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            
-            # Calculate statistics
-            if records:
-                scores = [r['score'] for r in records]
-                avg_score = sum(scores) / len(scores)
-                max_score = max(scores)
-                min_score = min(scores)
-                
-                state_counts = {}
-                for r in records:
-                    state_counts[r['state']] = state_counts.get(r['state'], 0) + 1
+            conn = get_db()
+            try:
+                # Statistics are aggregated by SQLite over the same page of rows
+                statistics = attention_statistics(conn.execute(stats_sql, params))
+                if not statistics['total_samples']:
+                    conn.close()
+                    return jsonify({'error': 'No attention history available'}), 404
                 
-                return jsonify({
-                    'records': records,
-                    'statistics': {
-                        'average_score': round(avg_score, 2),
-                        'max_score': max_score,
-                        'min_score': min_score,
-                        'state_distribution': state_counts,
-                        'total_samples': len(records)
-                    }
-                })
-            else:
-                return jsonify({'error': 'No attention history available'}), 404
+                cursor = conn.execute(history_sql, params)
+            except Exception:
+                conn.close()
+                raise
+            
+            return stream_json_list('records', cursor, conn, extra={
+                'statistics': statistics,
+                'offset': offset
+            })
         
         except Exception as e:
             logger.error(f"Error getting attention history: {e}")
@@ -1143,19 +1624,15 @@ def create_app():
     def start_time_block_session():
         """Start tracking a time block session"""
         try:
-            data = request.json
+            data = parse_json_body()
             block_name = data.get('block_name')
             block_type = data.get('block_type')
             goal_duration_minutes = data.get('goal_duration_minutes', 60)
             
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO time_block_sessions (
-                    block_name, block_type, start_time, goal_duration_minutes
-                ) VALUES (?, ?, datetime('now'), ?)
-            """, (block_name, block_type, goal_duration_minutes))
+            cursor.execute(INSERT_BLOCK_SESSION_SQL, (block_name, block_type, goal_duration_minutes))
             
             conn.commit()
             session_id = cursor.lastrowid
@@ -1175,37 +1652,37 @@ def create_app():
     def end_time_block_session(session_id):
         """End a time block session and record summary"""
         try:
-            data = request.json or {}
+            data = parse_json_body() or {}
             notes = data.get('notes', '')
             content_consumed = data.get('content_consumed', {})
             
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
-            # Get attention average for this session
-            cursor.execute("""
-                SELECT AVG(score) as avg_score
-                FROM attention_log
-                WHERE timestamp >= (
-                    SELECT start_time FROM time_block_sessions WHERE id = ?
-                )
-            """, (session_id,))
-            
-            result = cursor.fetchone()
-            avg_attention = result['avg_score'] if result else None
-            
-            # Update session
+            # Close the session and average its attention samples in one
+            # statement; the subquery reads start_time from the row itself
             cursor.execute("""
                 UPDATE time_block_sessions
                 SET end_time = datetime('now'),
-                    actual_duration_minutes = 
-                        (julianday('now') - julianday(start_time)) * 24 * 60,
-                    attention_average = ?,
+                    actual_duration_minutes =
+                        (strftime('%s', 'now') - strftime('%s', start_time)) / 60,
+                    attention_average = (
+                        SELECT AVG(score)
+                        FROM attention_log
+                        WHERE attention_log.timestamp >= time_block_sessions.start_time
+                    ),
                     content_consumed = ?,
                     session_notes = ?,
                     completed = TRUE
                 WHERE id = ?
-            """, (avg_attention, json.dumps(content_consumed), notes, session_id))
+            """, (dumps_json(content_consumed), notes, session_id))
+            
+            cursor.execute("""
+                SELECT attention_average FROM time_block_sessions WHERE id = ?
+            """, (session_id,))
+            
+            result = cursor.fetchone()
+            avg_attention = result['attention_average'] if result else None
             
             conn.commit()
             conn.close()
@@ -1245,7 +1722,7 @@ def create_app():
     def start_session():
         """Start a new learning block session"""
         try:
-            data = request.json or {}
+            data = parse_json_body() or {}
             block_name = data.get('block_name')
             block_type = data.get('block_type')
             goal_minutes = data.get('goal_minutes', 60)
@@ -1265,7 +1742,7 @@ def create_app():
     def end_session():
         """End current session"""
         try:
-            data = request.json or {}
+            data = parse_json_body() or {}
             avg_attention = data.get('avg_attention', 0)
             notes = data.get('notes', '')
             
@@ -1277,15 +1754,21 @@ def create_app():
             logger.error(f"Error ending session: {e}")
             return jsonify({'error': str(e)}), 500
     
+    @swr_cached(ttl=60, stale_ttl=600, maxsize=16)
+    def build_training_dataset(days):
+        """Aggregate the training dataset (cached; refreshed in the background)"""
+        return app.data_collector.get_training_dataset(days)
+    
     @app.route('/api/data/training-dataset', methods=['GET'])
     def get_training_dataset():
         """Get aggregated data for AI model training"""
         try:
-            days = request.args.get('days', 7, type=int)
-            dataset = app.data_collector.get_training_dataset(days)
-            
-            return jsonify(dataset)
+            # Bounded so clients cannot fill the cache with one entry per day count
+            args = schemas.parse_query(request.args, schemas.TrainingDatasetArgs)
+            return jsonify(build_training_dataset(args.days))
         
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error getting training dataset: {e}")
             return jsonify({'error': str(e)}), 500
@@ -1345,7 +1828,7 @@ def create_app():
     def log_activity():
         """Log user activity during time-block session"""
         try:
-            data = request.get_json()
+            data = parse_json_body()
             session_id = data.get('session_id')
             action = data.get('action')
             content_type = data.get('content_type')
@@ -1375,21 +1858,16 @@ def create_app():
         """Get page/URL activity history from current session"""
         try:
             limit = request.args.get('limit', 50, type=int)
-            db = sqlite3.connect(DB_PATH)
-            db.row_factory = sqlite3.Row
-            cursor = db.cursor()
-            
-            cursor.execute("""
-                SELECT id, timestamp, app_name, window_title, page_title, page_info_json, duration_seconds
-                FROM time_logs
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,))
+            offset = request.args.get('offset', 0, type=int)
             
-            logs = [dict(row) for row in cursor.fetchall()]
-            db.close()
+            conn = get_db()
+            try:
+                cursor = conn.execute(PAGE_ACTIVITY_SQL, (limit, offset))
+            except Exception:
+                conn.close()
+                raise
             
-            return jsonify({'page_activity': logs, 'count': len(logs)})
+            return stream_json_list('page_activity', cursor, conn, extra={'offset': offset}, count_key='count')
         except Exception as e:
             logger.error(f"Page activity error: {e}")
             return jsonify({'error': str(e)}), 500
@@ -1419,15 +1897,7 @@ def create_app():
             # Active block detected - check if requested content matches block type
             active_content_type = current_block.get('content_type')
             
-            # Map content type requests to block types
-            content_to_block_map = {
-                'science_youtube': 'science_youtube_and_papers',
-                'science_papers': 'science_youtube_and_papers',
-                'self_help_youtube': 'self_help_youtube',
-                'movies': 'artistic_movies'
-            }
-            
-            block_type_for_content = content_to_block_map.get(requested_content_type, requested_content_type)
+            block_type_for_content = CONTENT_TO_BLOCK_MAP.get(requested_content_type, requested_content_type)
             
             if block_type_for_content == active_content_type:
                 # Requested content matches current block
@@ -1457,39 +1927,31 @@ def create_app():
     def log_page_activity_post():
         """Log current app/page activity with focus state"""
         try:
-            data = request.json
+            data = parse_json_body()
             app_name = data.get('app_name')
             page_title = data.get('page_title')
             page_info = data.get('page_info', {})
             focus_state = data.get('focus_state', 'ACTIVE')
             
-            # Log the activity
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
-            cursor = conn.cursor()
-            
-            log_id = str(uuid.uuid4())
-            cursor.execute("""
-                INSERT INTO time_logs (
-                    id, timestamp, actual_app, page_title, 
-                    page_info_json, focus_state, duration_seconds
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+            # Queue the activity; the batch writer commits it shortly.
+            # The timestamp is taken now as local time (what the daily views
+            # filter on) and passed as text, so sqlite3's deprecated datetime
+            # adapter is never invoked.
+            log_id = new_id()
+            app.activity_writer.submit(INSERT_TIME_LOG_SQL, (
                 log_id,
-                datetime.now(),
+                datetime.now().isoformat(' '),
                 app_name,
                 page_title,
-                json.dumps(page_info),
+                dumps_json(page_info),
                 focus_state,
                 1
             ))
             
-            conn.commit()
-            conn.close()
-            
             return jsonify({
                 'logged': True,
                 'log_id': log_id
-            }), 201
+            }), 202
         
         except Exception as e:
             logger.error(f"Error logging page activity: {e}")
@@ -1499,40 +1961,31 @@ def create_app():
     def log_block_activity():
         """Log activity during active time block session"""
         try:
-            data = request.json
+            data = parse_json_body()
             session_id = data.get('session_id')
             action = data.get('action')
             content_type = data.get('content_type')
             page_title = data.get('page_title')
             attention_score = data.get('attention_score')
             
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO block_activity_log (
-                    session_id, timestamp, action, content_type, 
-                    page_title, attention_score
-                ) VALUES (?, datetime('now'), ?, ?, ?, ?)
-            """, (session_id, action, content_type, page_title, attention_score))
+            # Timestamp at request time (UTC, like datetime('now')), not at flush
+            now_utc = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            app.activity_writer.submit(INSERT_BLOCK_ACTIVITY_SQL, (
+                session_id, now_utc, action, content_type, page_title, attention_score
+            ))
             
             if action == 'content_view':
-                content_id = str(uuid.uuid4())
-                cursor.execute("""
-                    INSERT INTO session_content_log (
-                        session_id, content_id, content_type, title, metadata_json
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (session_id, content_id, content_type, page_title, 
-                      json.dumps({'timestamp': datetime.now().isoformat()})))
-            
-            conn.commit()
-            conn.close()
+                content_id = new_id()
+                app.activity_writer.submit(INSERT_SESSION_CONTENT_SQL, (
+                    session_id, content_id, content_type, page_title,
+                    dumps_json({'timestamp': datetime.now().isoformat()})
+                ))
             
             return jsonify({
                 'logged': True,
                 'session_id': session_id,
                 'action': action
-            }), 201
+            }), 202
         
         except Exception as e:
             logger.error(f"Error logging block activity: {e}")
@@ -1542,36 +1995,48 @@ def create_app():
     def get_session_activity(session_id):
         """Get all activity logged during a session"""
         try:
-            conn = get_db_connection(app.config['RFAI_DB_PATH'])
+            conn = get_db()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT timestamp, action, content_type, page_title, attention_score
-                FROM block_activity_log
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-            """, (session_id,))
-            
-            activities = [dict(row) for row in cursor.fetchall()]
-            
-            cursor.execute("""
-                SELECT content_id, content_type, title, metadata_json
-                FROM session_content_log
-                WHERE session_id = ?
-                ORDER BY id ASC
-            """, (session_id,))
-            
-            content_consumed = [dict(row) for row in cursor.fetchall()]
-            
-            conn.close()
-            
-            return jsonify({
-                'session_id': session_id,
-                'activities': activities,
-                'content_consumed': content_consumed,
-                'total_activities': len(activities),
-                'total_content_items': len(content_consumed)
-            })
+            # Revalidation is answered before the activity query runs
+            cursor.execute(SESSION_ACTIVITY_VERSION_SQL, (session_id,))
+            etag = cursor.fetchone()[0]
+            if request.if_none_match.contains(etag):
+                conn.close()
+                response = Response(status=304)
+                response.set_etag(etag)
+                return response
+            
+            # Plain tuples: each row only carries its kind and JSON text
+            cursor.row_factory = None
+            cursor.execute(SESSION_ACTIVITY_SQL, (session_id,))
+            
+            def generate():
+                # Rows arrive ordered by kind, so both lists stream in one pass
+                try:
+                    yield b'{"session_id":' + encode_json(session_id) + b',"activities":['
+                    counts = [0, 0]
+                    kind = 0
+                    separator = b''
+                    for row in cursor:
+                        if row[0] != kind:
+                            kind = 1
+                            yield b'],"content_consumed":['
+                            separator = b''
+                        yield separator + row[2].encode()
+                        separator = b','
+                        counts[kind] += 1
+                    if kind == 0:
+                        yield b'],"content_consumed":['
+                    yield (b'],"total_activities":' + encode_json(counts[0]) +
+                           b',"total_content_items":' + encode_json(counts[1]) + b'}')
+                finally:
+                    conn.close()
+            
+            response = Response(generate(), mimetype='application/json')
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
         
         except Exception as e:
             logger.error(f"Error getting session activity: {e}")
@@ -1585,13 +2050,15 @@ def create_app():
     def fetch_science_videos():
         """Fetch actual science YouTube videos"""
         try:
-            max_results = int(request.args.get('max_results', 10))
-            videos = app.content_fetcher.fetch_science_youtube(max_results=max_results)
+            args = schemas.parse_query(request.args, schemas.FetchArgs)
+            videos = fetch_content('fetch_science_youtube', args.max_results)
             return jsonify({
                 'videos': videos,
                 'count': len(videos),
                 'source': 'youtube_api' if videos and 'sample' not in videos[0].get('id', '') else 'sample_data'
             })
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error fetching science videos: {e}")
             return jsonify({'error': str(e)}), 500
@@ -1600,13 +2067,15 @@ def create_app():
     def fetch_selfhelp_videos():
         """Fetch actual self-help YouTube videos"""
         try:
-            max_results = int(request.args.get('max_results', 10))
-            videos = app.content_fetcher.fetch_self_help_youtube(max_results=max_results)
+            args = schemas.parse_query(request.args, schemas.FetchArgs)
+            videos = fetch_content('fetch_self_help_youtube', args.max_results)
             return jsonify({
                 'videos': videos,
                 'count': len(videos),
                 'source': 'youtube_api' if videos and 'selfhelp' not in videos[0].get('id', '') else 'sample_data'
             })
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error fetching self-help videos: {e}")
             return jsonify({'error': str(e)}), 500
@@ -1615,13 +2084,15 @@ def create_app():
     def fetch_papers():
         """Fetch actual research papers from ArXiv"""
         try:
-            max_results = int(request.args.get('max_results', 10))
-            papers = app.content_fetcher.fetch_research_papers(max_results=max_results)
+            args = schemas.parse_query(request.args, schemas.FetchArgs)
+            papers = fetch_content('fetch_research_papers', args.max_results)
             return jsonify({
                 'papers': papers,
                 'count': len(papers),
                 'source': 'arxiv_api' if papers else 'sample_data'
             })
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error fetching papers: {e}")
             return jsonify({'error': str(e)}), 500
@@ -1630,13 +2101,15 @@ def create_app():
     def fetch_movies():
         """Fetch movie recommendations"""
         try:
-            max_results = int(request.args.get('max_results', 10))
-            movies = app.content_fetcher.fetch_movies(max_results=max_results)
+            args = schemas.parse_query(request.args, schemas.FetchArgs)
+            movies = fetch_content('fetch_movies', args.max_results)
             return jsonify({
                 'movies': movies,
                 'count': len(movies),
                 'source': 'imdb_api' if movies else 'sample_data'
             })
+        except schemas.RequestValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Error fetching movies: {e}")
             return jsonify({'error': str(e)}), 500
@@ -1645,7 +2118,7 @@ def create_app():
     def fetch_study_plan_content():
         """Get content recommendations based on study plan using Perplexity"""
         try:
-            data = request.json
+            data = parse_json_body()
             study_plan = data.get('study_plan', '')
             
             if not study_plan:
@@ -1657,6 +2130,19 @@ def create_app():
             logger.error(f"Error generating study plan content: {e}")
             return jsonify({'error': str(e)}), 500
     
+    current_block_content = {}  # 'entry': (block key, content) for the active block
+    
+    def fetch_block_content(content_type):
+        """Fetch every listing for a block type concurrently"""
+        plan = BLOCK_FETCH_PLAN.get(content_type)
+        if plan is None:
+            return []
+        futures = [
+            (key, app.fetch_executor.submit(fetch_content, method, max_results))
+            for key, method, max_results in plan
+        ]
+        return {key: future.result() for key, future in futures}
+    
     @app.route('/api/fetch/current-block-content', methods=['GET'])
     def fetch_current_block_content():
         """Fetch actual content for current active time block"""
@@ -1670,27 +2156,18 @@ def create_app():
                     'content': []
                 })
             
-            content_type = block_info.get('content_type')
-            content = []
-            
-            if content_type == 'science_youtube_and_papers':
-                # Fetch both YouTube videos and papers
-                videos = app.content_fetcher.fetch_science_youtube(max_results=5)
-                papers = app.content_fetcher.fetch_research_papers(max_results=5)
-                content = {
-                    'youtube_videos': videos,
-                    'research_papers': papers
-                }
-            elif content_type == 'self_help_youtube':
-                videos = app.content_fetcher.fetch_self_help_youtube(max_results=10)
-                content = {
-                    'youtube_videos': videos
-                }
-            elif content_type == 'artistic_movies':
-                movies = app.content_fetcher.fetch_movies(max_results=10)
-                content = {
-                    'movies': movies
-                }
+            # Content is fetched once per block occurrence and then served
+            # from memory until the active block changes
+            block_key = (
+                datetime.now().date(), block_info.get('name'),
+                block_info.get('start_time'), block_info.get('content_type')
+            )
+            cached = current_block_content.get('entry')
+            if cached is not None and cached[0] == block_key:
+                content = cached[1]
+            else:
+                content = fetch_block_content(block_info.get('content_type'))
+                current_block_content['entry'] = (block_key, content)
             
             return jsonify({
                 'active': True,
@@ -1709,7 +2186,7 @@ def create_app():
     def generate_quiz():
         """Generate a quiz for a topic"""
         try:
-            data = request.json
+            data = parse_json_body()
             topic = data.get('topic')
             difficulty = data.get('difficulty', 'medium')
             num_questions = data.get('num_questions', 10)
@@ -1744,7 +2221,7 @@ def create_app():
     def submit_quiz(quiz_id):
         """Submit quiz answers and get results"""
         try:
-            data = request.json
+            data = parse_json_body()
             answers = data.get('answers', {})
             
             results = app.progress_tester.submit_quiz_answers(quiz_id, answers)
@@ -1779,11 +2256,52 @@ def create_app():
     return app
 
 
-def run_server(host='0.0.0.0', port=5000, debug=False):
-    """Run the Flask server"""
+if HAS_GUNICORN:
+    class GunicornServer(BaseApplication):
+        """Runs an already-created app under gunicorn with the given settings"""
+        
+        def __init__(self, app, options):
+            self.application = app
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return self.application
+
+
+def run_server(host='0.0.0.0', port=5000, debug=False, threads=8):
+    """
+    Run the API server
+    
+    Uses gunicorn (one gthread worker) when it is installed and debug is off;
+    otherwise falls back to Flask's development server.
+    
+    The app keeps per-process state (manual block override, sessions, current
+    block content, response caches), so it is served from a single process
+    and scales with threads rather than forked workers.
+    
+    Args:
+        threads: Request threads in the gunicorn worker
+    """
     app = create_app()
     logger.info(f"Starting RFAI API Server on {host}:{port}")
-    app.run(host=host, port=port, debug=debug)
+    
+    if debug or not HAS_GUNICORN:
+        if not debug:
+            logger.warning("gunicorn not installed; using Flask's development server")
+        app.run(host=host, port=port, debug=debug, threaded=True)
+        return
+    
+    GunicornServer(app, {
+        'bind': f"{host}:{port}",
+        'workers': 1,
+        'worker_class': 'gthread',
+        'threads': threads,
+    }).run()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,17 @@
+"""
+WSGI Entry Point
+Module-level app for production WSGI servers, e.g.
+
+    gunicorn -k gthread -w 1 --threads 8 -b 127.0.0.1:5000 rfai.api.wsgi:app
+"""
+
+import logging
+
+from rfai.api.server import create_app
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+app = create_app()
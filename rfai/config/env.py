@@ -13,10 +13,14 @@ This module intentionally never logs secret values.
 
 from __future__ import annotations
 
+import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
 _KEY_MAP = {
     # Common informal keys -> canonical env vars
@@ -39,114 +43,118 @@ _KEY_MAP = {
 }
 
 
-def _parse_env_line(line: str) -> Optional[Tuple[str, str]]:
-    stripped = line.strip()
-    if not stripped or stripped.startswith("#"):
-        return None
+# Where to get each key reported missing by print_api_key_status()
+_KEY_URLS = {
+    "YOUTUBE_API_KEY": "YouTube: https://console.cloud.google.com/apis/credentials",
+    "PERPLEXITY_API_KEY": "Perplexity: https://www.perplexity.ai/settings/api",
+    "NOTION_API_KEY": "Notion: https://www.notion.so/my-integrations",
+    "OMDB_API_KEY": "OMDb/IMDb: https://www.omdbapi.com/apikey.aspx",
+}
+
 
-    # Allow inline comments: KEY=VALUE  # comment
-    if "#" in stripped:
-        before_hash = stripped.split("#", 1)[0].strip()
-        if before_hash:
-            stripped = before_hash
+# One `[export] KEY = VALUE  # comment` assignment per line; blank lines,
+# comment lines and lines without `=` simply don't match. Horizontal
+# whitespace is `[^\S\n]` so a match never runs onto the next line.
+_ENV_LINE_RE = re.compile(
+    rb"^[^\S\n]*(?:export[^\S\n]+)?([^#=\n]*[^#=\s])[^\S\n]*=[^\S\n]*([^#\n]*?)[^\S\n]*(?:#.*)?$",
+    re.MULTILINE,
+)
 
-    if "=" not in stripped:
-        return None
 
-    key, value = stripped.split("=", 1)
-    key = key.strip()
-    value = value.strip()
+def _iter_env_pairs(raw: bytes) -> Iterator[Tuple[str, str]]:
+    """Yield (key, value) for each assignment in raw `.env` bytes, in order.
 
-    # Strip optional quotes
-    if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-        value = value[1:-1]
+    Only the matched key and value are decoded, not the whole file.
+    """
+    for match in _ENV_LINE_RE.finditer(raw):
+        key, value = match.groups()
 
-    if not key:
-        return None
+        # Strip optional quotes
+        if value[:1] == value[-1:] and value[:1] in (b'"', b"'"):
+            value = value[1:-1]
 
-    return key, value
+        yield key.decode("utf-8", "ignore"), value.decode("utf-8", "ignore")
 
 
 def _find_dotenv() -> Optional[Path]:
     """Find a `.env` file by searching common roots."""
-    explicit = os.environ.get("RFAI_ENV_FILE")
-    if explicit:
-        p = Path(explicit).expanduser().resolve()
-        return p if p.exists() else None
-
-    candidates = []
-
-    # Prefer current working directory first
     try:
-        candidates.append(Path.cwd())
+        cwd: Optional[str] = os.getcwd()
     except Exception:
-        pass
-
-    # Then search upwards from this file
-    here = Path(__file__).resolve()
-    candidates.extend([here.parent] + list(here.parents))
-
-    seen = set()
-    for base in candidates:
-        if str(base) in seen:
-            continue
-        seen.add(str(base))
+        cwd = None
 
-        env_path = base / ".env"
-        if env_path.exists():
-            return env_path
+    return _search_dotenv(os.environ.get("RFAI_ENV_FILE"), cwd)
 
-    return None
 
+@lru_cache(maxsize=1)
+def _search_dotenv(explicit: Optional[str], cwd: Optional[str]) -> Optional[Path]:
+    """Filesystem walk behind `_find_dotenv`, cached per (RFAI_ENV_FILE, cwd)."""
+    if explicit:
+        p = Path(explicit).expanduser().resolve()
+        return p if p.exists() else None
 
+    # Prefer current working directory first
+    if cwd is not None:
+        env_path = os.path.join(cwd, ".env")
+        if os.path.isfile(env_path):
+            return Path(env_path)
+
+    # Then search upwards from this file, stopping at the first hit
+    base = os.path.dirname(os.path.realpath(__file__))
+    while True:
+        env_path = os.path.join(base, ".env")
+        if os.path.isfile(env_path):
+            return Path(env_path)
+        parent = os.path.dirname(base)
+        if parent == base:
+            return None
+        base = parent
+
+
+@lru_cache(maxsize=2)
 def load_env(override: bool = False) -> Dict[str, str]:
     """Load `.env` into `os.environ` and normalize keys.
 
     Returns a dict of keys that were set (key -> value). Values are returned to
     support debugging in code, but callers should not print them.
+
+    The file is read once per process for each `override` value; later calls
+    return the first call's result. Use `load_env.cache_clear()` to re-read it.
     """
     env_path = _find_dotenv()
     if not env_path:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning("No .env file found. Create one from .env.example for API key configuration.")
         logger.info("Looking for .env in: current directory or project root")
         return {}
 
     try:
-        raw_text = env_path.read_text(encoding="utf-8", errors="ignore")
+        raw = env_path.read_bytes()
     except Exception:
         return {}
 
-    set_vars: Dict[str, str] = {}
-
-    for line in raw_text.splitlines():
-        parsed = _parse_env_line(line)
-        if not parsed:
-            continue
+    # Collect every target first: a name assigned more than once (e.g. both
+    # `youtube` and `YOUTUBE_API_KEY`) resolves here instead of in os.environ.
+    # Without override the first assignment wins, as an already-set variable would.
+    pending: Dict[str, str] = {}
+    assign = pending.__setitem__ if override else pending.setdefault
 
-        key, value = parsed
+    for key, value in _iter_env_pairs(raw):
         key_stripped = key.strip()
 
-        def _set(name: str, val: str) -> None:
-            if override or name not in os.environ:
-                os.environ[name] = val
-                set_vars[name] = val
-
         # Always set the raw key if it's a reasonable env var name
         if key_stripped:
-            _set(key_stripped, value)
+            assign(key_stripped, value)
 
-        # Normalize common informal keys
+        # Normalize common informal keys (any case; _KEY_MAP keys are lowercase)
         mapped = _KEY_MAP.get(key_stripped.lower())
         if mapped:
-            _set(mapped, value)
+            assign(mapped, value)
 
-        # If they provided canonical keys but with wrong case, normalize too
-        upper = key_stripped.upper()
-        mapped2 = _KEY_MAP.get(upper.lower())
-        if mapped2:
-            _set(mapped2, value)
+    set_vars: Dict[str, str] = {}
+    for name, value in pending.items():
+        if override or name not in os.environ:
+            os.environ[name] = value
+            set_vars[name] = value
 
     return set_vars
 
@@ -182,9 +190,6 @@ def validate_api_keys(required_keys: list = None) -> Dict[str, bool]:
 
 def print_api_key_status():
     """Print helpful status message about API key configuration"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     status = validate_api_keys()
     
     missing_keys = [k for k, v in status.items() if not v]
@@ -198,11 +203,6 @@ def print_api_key_status():
         logger.info("Create a .env file from .env.example and add your API keys")
         logger.info("Get keys from:")
         for key in missing_keys:
-            if 'YOUTUBE' in key:
-                logger.info("  - YouTube: https://console.cloud.google.com/apis/credentials")
-            elif 'PERPLEXITY' in key:
-                logger.info("  - Perplexity: https://www.perplexity.ai/settings/api")
-            elif 'NOTION' in key:
-                logger.info("  - Notion: https://www.notion.so/my-integrations")
-            elif 'OMDB' in key:
-                logger.info("  - OMDb/IMDb: https://www.omdbapi.com/apikey.aspx")
+            url = _KEY_URLS.get(key)
+            if url:
+                logger.info(f"  - {url}")
@@ -14,9 +14,151 @@ from pathlib import Path
 from typing import Optional, Dict, List
 import sqlite3
 import threading
+from collections import deque
+from operator import itemgetter
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Frames are downscaled to this width before face detection
+CAMERA_DETECT_WIDTH = 320
+
+# Run the eye cascade on one camera sample in this many
+EYE_CHECK_EVERY = 6
+
+# Skip camera detection once keyboard and mouse have both been idle this long (seconds)
+IDLE_GATE_SECONDS = 30
+
+# Attention events buffered before a batched insert (~1 min at 5s intervals)
+LOG_FLUSH_ROWS = 12
+
+# Lower score bounds of DISTRACTED, ACTIVE and FOCUSED (see classify_state)
+_STATE_THRESHOLDS = np.array([30.0, 55.0, 75.0])
+_STATES = np.array(["INACTIVE", "DISTRACTED", "ACTIVE", "FOCUSED"])
+
+# Fixed signal set, serialized by template instead of json.dumps per tick
+SIGNAL_KEYS = ('camera', 'microphone', 'keyboard', 'mouse', 'cpu', 'window')
+SIGNALS_JSON_TEMPLATE = '{' + ', '.join(f'"{key}": %.4f' for key in SIGNAL_KEYS) + '}'
+_signal_values = itemgetter(*SIGNAL_KEYS)
+
+# Same definitions as database/schema.sql
+ATTENTION_LOG_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS attention_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        timestamp DATETIME NOT NULL,
+        state TEXT NOT NULL,
+        score REAL,
+        confidence REAL,
+        trend REAL,
+        signals_json TEXT,
+        capabilities_json TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_attention_log_timestamp ON attention_log(timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_attention_log_session ON attention_log(session_id, timestamp DESC)",
+)
+
+ATTENTION_INSERT_SQL = """
+    INSERT INTO attention_log (
+        session_id, timestamp, state, score, confidence,
+        trend, signals_json, capabilities_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _neutral_signal() -> float:
+    """Signal for an input that is unavailable on this machine"""
+    return 0.5
+
+
+class _CameraGrabber(threading.Thread):
+    """
+    Keeps the capture device drained so every sample sees the newest frame
+    
+    grab() only pulls the next frame off the driver (no decode), paced by the
+    camera's frame rate; latest_frame() decodes just the frame being sampled.
+    """
+    
+    def __init__(self, camera):
+        super().__init__(name="camera-grabber", daemon=True)
+        self.camera = camera
+        self._lock = threading.Lock()
+        self._has_frame = False
+        self._frame = None  # Decode target reused across latest_frame() calls
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        while not self._stop_event.is_set():
+            with self._lock:
+                grabbed = self.camera.grab()
+                self._has_frame = self._has_frame or grabbed
+            if not grabbed:
+                self._stop_event.wait(0.1)
+    
+    def latest_frame(self):
+        """
+        Decode and return the most recently grabbed frame, or None
+        
+        The frame is decoded into a reused buffer, so it is only valid until
+        the next call.
+        """
+        with self._lock:
+            if not self._has_frame:
+                return None
+            ok, frame = self.camera.retrieve(self._frame)
+        if not ok:
+            return None
+        self._frame = frame
+        return frame
+    
+    def stop(self, timeout: float = 1.0):
+        self._stop_event.set()
+        self.join(timeout)
+
+
+class _WindowTracker(threading.Thread):
+    """
+    Background poller that counts foreground-app switches
+    
+    Asks get_foreground() for the focused app once per poll and keeps the
+    per-poll switch flags in a 60-slot ring, so the number of switches in the
+    last minute is a running total that readers get without any API call.
+    """
+    
+    def __init__(self, get_foreground, poll_seconds: float = 1.0):
+        super().__init__(name="window-tracker", daemon=True)
+        self.get_foreground = get_foreground
+        self.poll_seconds = poll_seconds
+        self.switches_last_min = 0
+        self._slots = [0] * 60
+        self._slot = 0
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        last = None
+        while not self._stop_event.wait(self.poll_seconds):
+            try:
+                current = self.get_foreground()
+            except Exception as e:
+                logger.debug(f"Foreground window query failed: {e}")
+                current = last
+            
+            switched = int(last is not None and current != last)
+            last = current
+            
+            self._slot = (self._slot + 1) % len(self._slots)
+            self.switches_last_min += switched - self._slots[self._slot]
+            self._slots[self._slot] = switched
+    
+    def stop(self, timeout: float = 2.0):
+        self._stop_event.set()
+        self.join(timeout)
+
 
 class AttentionMonitorDaemon:
     """
@@ -43,6 +185,10 @@ class AttentionMonitorDaemon:
         self.db_path = db_path
         self.interval = interval_seconds
         self.running = False
+        
+        # Sampling backs off while INACTIVE; input events reset it and wake the loop
+        self._current_interval = interval_seconds
+        self._wake = threading.Event()
         self.platform = platform.system()
         
         # Attention weights (multimodal fusion)
@@ -54,12 +200,23 @@ class AttentionMonitorDaemon:
             'window': 0.15,      # Window focus stability
             'cpu': 0.05          # CPU usage patterns
         }
+        total_weight = sum(self.weights.values())
+        self._normalized_weights = {
+            key: weight / total_weight for key, weight in self.weights.items()
+        }
         
         # State tracking
         self.last_state = "INACTIVE"
         self.state_duration = 0
-        self.focus_history = []  # Rolling window of attention scores
+        self._last_tick = time.monotonic()
+        # Timestamp string reused while the wall-clock second is unchanged
+        self._last_ts_sec = None
+        self._last_ts_str = None
         self.max_history = 60  # Track last 60 samples
+        self.focus_history = deque(maxlen=self.max_history)  # Rolling window of attention scores
+        # Running sums of the last 10 scores and the 10 before them (for trend)
+        self._recent_sum = 0.0
+        self._older_sum = 0.0
         
         # Session tracking
         self.session_id = str(uuid.uuid4())
@@ -68,6 +225,10 @@ class AttentionMonitorDaemon:
         self.total_distracted_time = 0
         self.current_block = None  # Track which time block we're in
         
+        # Batched attention_log writes over one long-lived connection
+        self._pending_rows = []
+        self._conn = self._open_db()
+        
         logger.info(f"Attention Monitor initialized on {self.platform}")
         logger.info(f"Session ID: {self.session_id}")
         logger.info(f"Monitor interval: {self.interval}s")
@@ -76,12 +237,44 @@ class AttentionMonitorDaemon:
         self._setup_camera()
         self._setup_microphone()
         self._setup_system_monitoring()
+        self._setup_window_tracking()
+        
+        # Signals without a working source report neutral through a stub bound
+        # here, so the per-tick path needs no availability checks
+        if not self.microphone_available:
+            self._get_microphone_signal = _neutral_signal
+        if not self.system_monitoring_available:
+            self._get_keyboard_signal = _neutral_signal
+            self._get_mouse_signal = _neutral_signal
+            self._get_cpu_signal = _neutral_signal
+        if self.window_tracker is None:
+            self._get_window_signal = _neutral_signal
+        
+        # Capabilities are fixed once setup is done; serialize them once
+        self._capabilities_json = json.dumps({
+            'camera': self.camera_available,
+            'microphone': self.microphone_available,
+            'system': self.system_monitoring_available
+        })
+        
+        # Face detection runs on a worker while the cheap signals are read;
+        # one worker keeps detections (and their eye-check state) sequential
+        self._executor = None
+        self._camera_future = None
+        if self.camera_available:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='attn')
     
     def _setup_camera(self):
         """Setup camera/webcam for eye tracking or head pose"""
         self.camera_available = False
         self.camera = None
+        self.camera_grabber = None
         self.eye_tracker = None
+        self._eye_check_countdown = 0
+        self._last_face_signal = 0.5
+        # Per-frame scratch arrays, reallocated only if the frame size changes
+        self._small_buf = None
+        self._gray_buf = None
         
         try:
             import cv2
@@ -99,6 +292,12 @@ class AttentionMonitorDaemon:
                 
                 eye_cascade_path = cv2.data.haarcascades + 'haarcascade_eye.xml'
                 self.eye_cascade = cv2.CascadeClassifier(eye_cascade_path)
+                
+                # Keep at most one frame queued in the driver and drain it
+                # continuously, so samples are never seconds old
+                self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                self.camera_grabber = _CameraGrabber(self.camera)
+                self.camera_grabber.start()
             else:
                 logger.warning("Camera not available or denied permission")
                 if self.camera:
@@ -112,12 +311,20 @@ class AttentionMonitorDaemon:
         """Setup microphone for voice activity detection"""
         self.microphone_available = False
         self.audio_stream = None
+        self._last_rms = 0.0
         
         try:
             import pyaudio
-            import wave
             
+            self._pa_continue = pyaudio.paContinue
             self.pyaudio = pyaudio.PyAudio()
+            # Callback mode: PortAudio's thread hands us each block and the
+            # monitor loop just reads the latest RMS, never blocking on read()
+            self.audio_stream = self.pyaudio.open(
+                format=pyaudio.paInt16, channels=1, rate=16000,
+                frames_per_buffer=1024, input=True,
+                stream_callback=self._audio_callback
+            )
             self.microphone_available = True
             logger.info("✅ Microphone available for voice activity detection")
             
@@ -129,23 +336,41 @@ class AttentionMonitorDaemon:
     def _setup_system_monitoring(self):
         """Setup system-wide monitoring (keyboard, mouse, CPU)"""
         self.system_monitoring_available = False
+        self.keyboard_listener = None
+        self.mouse_listener = None
         
         try:
             import psutil
             from pynput import keyboard, mouse
             
             self.psutil = psutil
+            # Prime the CPU counters: later interval=None calls return usage
+            # since the previous call instead of sleeping to measure it
+            psutil.cpu_percent(interval=None)
             self.keyboard = keyboard
             self.mouse = mouse
-            self.system_monitoring_available = True
             
             # Initialize input tracking
-            self.last_keyboard_time = time.time()
-            self.last_mouse_time = time.time()
+            self.last_keyboard_time = time.monotonic()
+            self.last_mouse_time = time.monotonic()
             self.last_mouse_pos = None
             self.keyboard_event_count = 0
             self.mouse_event_count = 0
             
+            # OS input events stamp the last-activity times from pynput's own
+            # threads; the monitor loop only reads them
+            self.keyboard_listener = keyboard.Listener(on_press=self._on_key_press)
+            self.mouse_listener = mouse.Listener(
+                on_move=self._on_mouse_move,
+                on_click=self._on_mouse_event,
+                on_scroll=self._on_mouse_event
+            )
+            self.keyboard_listener.daemon = True
+            self.mouse_listener.daemon = True
+            self.keyboard_listener.start()
+            self.mouse_listener.start()
+            self.system_monitoring_available = True
+            
             logger.info("✅ System monitoring (keyboard, mouse, CPU) available")
             
         except ImportError:
@@ -153,6 +378,62 @@ class AttentionMonitorDaemon:
         except Exception as e:
             logger.warning(f"System monitoring setup failed: {e}")
     
+    def _setup_window_tracking(self):
+        """Setup foreground-app polling for window focus stability"""
+        self.window_tracker = None
+        get_foreground = None
+        
+        try:
+            if self.platform == "Windows":
+                import win32gui
+                import win32process
+                
+                def windows_foreground():
+                    hwnd = win32gui.GetForegroundWindow()
+                    return win32process.GetWindowThreadProcessId(hwnd)[1]
+                
+                get_foreground = windows_foreground
+            
+            elif self.platform == "Darwin":
+                from AppKit import NSWorkspace
+                workspace = NSWorkspace.sharedWorkspace()
+                
+                def macos_foreground():
+                    return workspace.frontmostApplication().processIdentifier()
+                
+                get_foreground = macos_foreground
+            
+            elif self.platform == "Linux":
+                from Xlib import X, display
+                xdisplay = display.Display()
+                root = xdisplay.screen().root
+                active_window_atom = xdisplay.intern_atom('_NET_ACTIVE_WINDOW')
+                pid_atom = xdisplay.intern_atom('_NET_WM_PID')
+                
+                def x11_foreground():
+                    active = root.get_full_property(active_window_atom, X.AnyPropertyType)
+                    if not active or not active.value[0]:
+                        return None
+                    window = xdisplay.create_resource_object('window', active.value[0])
+                    pid = window.get_full_property(pid_atom, X.AnyPropertyType)
+                    # Windows without a PID are compared by window id instead
+                    return pid.value[0] if pid else active.value[0]
+                
+                get_foreground = x11_foreground
+            
+        except ImportError:
+            logger.warning(
+                "Window tracking not available - install pywin32 (Windows), "
+                "pyobjc-framework-Cocoa (macOS) or python-xlib (Linux)"
+            )
+        except Exception as e:
+            logger.warning(f"Window tracking setup failed: {e}")
+        
+        if get_foreground is not None:
+            self.window_tracker = _WindowTracker(get_foreground)
+            self.window_tracker.start()
+            logger.info("✅ Window focus tracking available")
+    
     def compute_attention_score(self) -> Dict:
         """
         Compute multimodal attention score (0-100)
@@ -162,63 +443,75 @@ class AttentionMonitorDaemon:
         """
         signals = {}
         
-        # Camera signal: face/eye detection
-        if self.camera_available:
-            signals['camera'] = self._get_camera_signal()
-        else:
-            signals['camera'] = 0.5  # Neutral
+        # System signals (cheap, and read first so they can gate the camera)
+        signals['keyboard'] = self._get_keyboard_signal()
+        signals['mouse'] = self._get_mouse_signal()
+        signals['cpu'] = self._get_cpu_signal()
         
-        # Microphone signal: voice activity
-        if self.microphone_available:
-            signals['microphone'] = self._get_microphone_signal()
-        else:
-            signals['microphone'] = 0.5
+        # No keyboard or mouse input for a while: nobody is working at the
+        # screen, so skip face detection until the listeners see input again
+        camera_future = None
+        if self.system_monitoring_available and (
+                time.monotonic() - max(self.last_keyboard_time, self.last_mouse_time)
+                > IDLE_GATE_SECONDS):
+            signals['camera'] = 0.0
+        elif self._executor is not None:
+            # Camera signal: face/eye detection, started here and joined below.
+            # A detection still running from an earlier tick is left to finish
+            camera_future = self._camera_future
+            if camera_future is None or camera_future.done():
+                camera_future = self._camera_future = self._executor.submit(self._get_camera_signal)
         
-        # System signals
-        if self.system_monitoring_available:
-            signals['keyboard'] = self._get_keyboard_signal()
-            signals['mouse'] = self._get_mouse_signal()
-            signals['cpu'] = self._get_cpu_signal()
-        else:
-            signals['keyboard'] = 0.5
-            signals['mouse'] = 0.5
-            signals['cpu'] = 0.5
+        # Microphone signal: voice activity
+        signals['microphone'] = self._get_microphone_signal()
         
         signals['window'] = self._get_window_signal()
         
-        # Compute weighted composite score
-        composite_score = sum(
-            self.weights.get(key, 0) * value
-            for key, value in signals.items()
-        ) / sum(self.weights.values())
+        if camera_future is not None:
+            try:
+                signals['camera'] = camera_future.result(timeout=self.interval * 0.8)
+            except FutureTimeoutError:
+                logger.debug("Camera signal timed out")
+        signals.setdefault('camera', 0.5)  # Neutral
         
-        # Scale to 0-100
-        composite_score = composite_score * 100
+        # Compute weighted composite score, scaled to 0-100
+        w = self._normalized_weights
+        composite_score = (
+            w['camera'] * signals['camera']
+            + w['microphone'] * signals['microphone']
+            + w['keyboard'] * signals['keyboard']
+            + w['mouse'] * signals['mouse']
+            + w['window'] * signals['window']
+            + w['cpu'] * signals['cpu']
+        ) * 100.0
         
-        # Add to history
-        self.focus_history.append(composite_score)
-        if len(self.focus_history) > self.max_history:
-            self.focus_history.pop(0)
+        # Add to history, sliding both trend windows along by one sample
+        history = self.focus_history
+        if len(history) >= 10:
+            self._recent_sum -= history[-10]
+            self._older_sum += history[-10]
+        if len(history) >= 20:
+            self._older_sum -= history[-20]
+        self._recent_sum += composite_score
+        history.append(composite_score)
         
         # Classify state with hysteresis
-        if composite_score >= 75:
-            new_state = "FOCUSED"
-        elif composite_score >= 55:
-            new_state = "ACTIVE"
-        elif composite_score >= 30:
-            new_state = "DISTRACTED"
-        else:
-            new_state = "INACTIVE"
+        new_state = self.classify_state(composite_score)
         
-        # Smooth state transitions (avoid rapid changes)
+        # Smooth state transitions (avoid rapid changes); durations use the
+        # monotonic clock so wall-clock jumps don't distort the hysteresis
+        tick = time.monotonic()
+        elapsed = tick - self._last_tick
+        self._last_tick = tick
         if new_state != self.last_state:
             self.state_duration = 0
         else:
-            self.state_duration += self.interval
+            self.state_duration += elapsed
         
         # Only change state if new state persists > 10s
-        if self.state_duration < 10 and self.last_state != "INACTIVE":
-            state = self.last_state
+        previous_state = self.last_state
+        if self.state_duration < 10 and previous_state != "INACTIVE":
+            state = previous_state
         else:
             state = new_state
             self.last_state = state
@@ -227,17 +520,16 @@ class AttentionMonitorDaemon:
         confidence = min(0.95, 0.5 + (self.state_duration / 60))
         
         # Calculate trend (is attention improving or degrading?)
-        if len(self.focus_history) > 10:
-            recent_avg = sum(self.focus_history[-10:]) / 10
-            older_avg = sum(self.focus_history[-20:-10]) / 10
-            trend = recent_avg - older_avg  # positive = improving
+        if len(history) > 10:
+            trend = (self._recent_sum - self._older_sum) / 10.0  # positive = improving
         else:
             trend = 0
         
         return {
             'session_id': self.session_id,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._timestamp(),
             'state': state,
+            'state_changed': state != previous_state,
             'score': composite_score,
             'confidence': confidence,
             'trend': trend,
@@ -249,106 +541,185 @@ class AttentionMonitorDaemon:
             }
         }
     
+    def classify_state(self, score: float) -> str:
+        """Map one 0-100 composite score to a state name (before hysteresis)"""
+        if score >= 75:
+            return "FOCUSED"
+        elif score >= 55:
+            return "ACTIVE"
+        elif score >= 30:
+            return "DISTRACTED"
+        else:
+            return "INACTIVE"
+    
+    def classify_state_batch(self, scores) -> np.ndarray:
+        """
+        Classify many attention scores at once (e.g. re-scoring a day's log)
+        
+        Vectorized classify_state(): same thresholds as the live tick,
+        without its hysteresis.
+        
+        Args:
+            scores: Array-like of 0-100 composite scores
+            
+        Returns:
+            Array of state names, one per score
+        """
+        # side='right' so a score equal to a threshold lands in the higher state
+        return _STATES[np.searchsorted(_STATE_THRESHOLDS, scores, side='right')]
+    
+    def _timestamp(self) -> str:
+        """Local ISO-8601 timestamp (second precision), formatted once per second"""
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        return self._last_ts_str
+    
     def _get_camera_signal(self) -> float:
         """
         Get camera-based attention signal using face/eye detection
         0.0 = not looking at screen, 1.0 = focused on screen
         """
         try:
-            if not self.camera or not self.camera.isOpened():
+            if not self.camera_grabber:
                 return 0.5
             
-            ret, frame = self.camera.read()
-            if not ret:
+            frame = self.camera_grabber.latest_frame()
+            if frame is None:
                 return 0.5
             
-            gray = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2GRAY)
+            cv2 = self.cv2
+            
+            # Haar cost scales with pixel count; faces at a desk stay well
+            # above the cascade's 24px window at this width
+            height, width = frame.shape[:2]
+            if width > CAMERA_DETECT_WIDTH:
+                small_shape = (height * CAMERA_DETECT_WIDTH // width, CAMERA_DETECT_WIDTH, 3)
+                if self._small_buf is None or self._small_buf.shape != small_shape:
+                    self._small_buf = np.empty(small_shape, dtype=np.uint8)
+                frame = cv2.resize(
+                    frame, small_shape[1::-1], dst=self._small_buf,
+                    interpolation=cv2.INTER_AREA
+                )
+            
+            if self._gray_buf is None or self._gray_buf.shape != frame.shape[:2]:
+                self._gray_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
             
             # Detect faces
             faces = self.face_cascade.detectMultiScale(
-                gray, scaleFactor=1.3, minNeighbors=4, minSize=(30, 30)
+                gray, scaleFactor=1.3, minNeighbors=4, minSize=(24, 24)
             )
             
             if len(faces) == 0:
                 return 0.0  # No face detected = not focused
             
+            # The eye cascade only runs every few samples (and right after a
+            # state change); in between a visible face keeps the last verdict
+            self._eye_check_countdown -= 1
+            if self._eye_check_countdown > 0 and self.state_duration > 0:
+                return self._last_face_signal
+            self._eye_check_countdown = EYE_CHECK_EVERY
+            
             # Detect eyes in face region
+            eye_cascade = self.eye_cascade
+            self._last_face_signal = 0.5  # Face detected but no eyes = ambiguous
             for (x, y, w, h) in faces:
                 roi_gray = gray[y:y+h, x:x+w]
-                eyes = self.eye_cascade.detectMultiScale(roi_gray)
+                eyes = eye_cascade.detectMultiScale(roi_gray)
                 
                 if len(eyes) > 0:
-                    return 0.9  # Face and eyes detected = focused
+                    self._last_face_signal = 0.9  # Face and eyes detected = focused
+                    break
             
-            return 0.5  # Face detected but no eyes = ambiguous
+            return self._last_face_signal
             
         except Exception as e:
             logger.debug(f"Camera signal error: {e}")
             return 0.5
     
+    def _on_key_press(self, key):
+        """pynput callback: record keyboard activity"""
+        self.last_keyboard_time = time.monotonic()
+        self.keyboard_event_count += 1
+        self._on_user_input()
+    
+    def _on_mouse_move(self, x, y):
+        """pynput callback: record mouse movement"""
+        self.last_mouse_time = time.monotonic()
+        self.last_mouse_pos = (x, y)
+        self.mouse_event_count += 1
+        self._on_user_input()
+    
+    def _on_mouse_event(self, *args):
+        """pynput callback: record mouse clicks and scrolling"""
+        self.last_mouse_time = time.monotonic()
+        self.mouse_event_count += 1
+        self._on_user_input()
+    
+    def _on_user_input(self):
+        """Return to the base sampling interval, cutting a backed-off sleep short"""
+        if self._current_interval != self.interval:
+            self._current_interval = self.interval
+            self._wake.set()
+    
     def _get_microphone_signal(self) -> float:
         """
         Get microphone-based voice activity signal
         0.0 = silent, 1.0 = speaking/audio detected
         """
-        try:
-            # Simple amplitude-based detection
-            # In production, use librosa or scipy for better feature extraction
-            return 0.3  # Placeholder - most learning is silent
-        except Exception as e:
-            logger.debug(f"Microphone signal error: {e}")
-            return 0.5
+        # Simple amplitude-based detection; RMS of ~0.125 full scale saturates
+        return min(1.0, self._last_rms * 8.0)
+    
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback: update the running RMS of the input"""
+        samples = np.frombuffer(in_data, dtype=np.int16).astype(np.float32)
+        if samples.size:
+            self._last_rms = float(np.sqrt(np.dot(samples, samples) / samples.size)) / 32768.0
+        return (None, self._pa_continue)
     
     def _get_keyboard_signal(self) -> float:
         """
         Get keyboard activity signal
         0.0 = no typing, 1.0 = active typing
         """
-        try:
-            current_time = time.time()
-            time_since_last_input = current_time - self.last_keyboard_time
-            
-            # If typed in last 10 seconds, score decreases over time
-            if time_since_last_input < 10:
-                return max(0.0, 1.0 - (time_since_last_input / 10))
-            else:
-                return 0.0
-        except Exception:
-            return 0.5
+        time_since_last_input = time.monotonic() - self.last_keyboard_time
+        
+        # If typed in last 10 seconds, score decreases over time
+        if time_since_last_input < 10:
+            return max(0.0, 1.0 - (time_since_last_input / 10))
+        else:
+            return 0.0
     
     def _get_mouse_signal(self) -> float:
         """
         Get mouse activity signal
         0.0 = mouse idle, 1.0 = active movement/clicks
         """
-        try:
-            current_time = time.time()
-            time_since_last_input = current_time - self.last_mouse_time
-            
-            # If moved/clicked in last 15 seconds, score decreases
-            if time_since_last_input < 15:
-                return max(0.0, 1.0 - (time_since_last_input / 15))
-            else:
-                return 0.0
-        except Exception:
-            return 0.5
+        time_since_last_input = time.monotonic() - self.last_mouse_time
+        
+        # If moved/clicked in last 15 seconds, score decreases
+        if time_since_last_input < 15:
+            return max(0.0, 1.0 - (time_since_last_input / 15))
+        else:
+            return 0.0
     
     def _get_cpu_signal(self) -> float:
         """
         Get CPU usage signal (normalized 0-1)
         Moderate CPU = focused work, extreme CPU = distraction/heavy load
         """
-        try:
-            cpu_percent = self.psutil.cpu_percent(interval=0.1) / 100.0
-            
-            # Map CPU to focus: moderate (30-60%) = focused, extreme = distracted
-            if 0.3 <= cpu_percent <= 0.6:
-                return 0.8
-            elif cpu_percent > 0.6:
-                return 0.4  # High CPU might be distraction
-            else:
-                return 0.5
-        except Exception:
+        # Usage since the previous sample (one monitor interval); the
+        # first reading only covers the time since setup
+        cpu_percent = self.psutil.cpu_percent(interval=None) / 100.0
+        
+        # Map CPU to focus: moderate (30-60%) = focused, extreme = distracted
+        if 0.3 <= cpu_percent <= 0.6:
+            return 0.8
+        elif cpu_percent > 0.6:
+            return 0.4  # High CPU might be distraction
+        else:
             return 0.5
     
     def _get_window_signal(self) -> float:
@@ -356,36 +727,74 @@ class AttentionMonitorDaemon:
         Get window focus stability signal
         1.0 = same app focused whole time, 0.0 = rapidly switching apps
         """
-        # Simplified: in production, track app switches
-        return 0.7  # Placeholder
+        # Ten or more app switches in the last minute = no stable focus
+        return max(0.0, 1.0 - self.window_tracker.switches_last_min / 10.0)
+    
+    def _open_db(self):
+        """Open the daemon's long-lived connection (autocommit; batches use explicit BEGIN)"""
+        conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Wait out other daemons' write locks instead of failing the batch
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # The daemon may start before init_database has run on this file
+        for statement in ATTENTION_LOG_DDL:
+            conn.execute(statement)
+        return conn
     
     def log_attention_event(self, attention_data: Dict):
-        """Log attention event to database"""
+        """Queue attention event for the next batched write to the database"""
+        self._pending_rows.append((
+            attention_data['session_id'],
+            attention_data['timestamp'],
+            attention_data['state'],
+            attention_data['score'],
+            attention_data['confidence'],
+            attention_data['trend'],
+            SIGNALS_JSON_TEMPLATE % _signal_values(attention_data['signals']),
+            self._capabilities_json
+        ))
+        
+        if len(self._pending_rows) >= LOG_FLUSH_ROWS:
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        """Write all queued attention events in one transaction"""
+        if not self._pending_rows:
+            return
+        
+        rows = self._pending_rows
+        self._pending_rows = []
+        for attempt in range(2):
+            try:
+                self._write_rows(rows)
+                return
+            except sqlite3.OperationalError as e:
+                # Still locked after busy_timeout: another daemon holds a long
+                # write, so give it one more timeout's worth of waiting
+                if attempt == 0:
+                    logger.debug(f"Retrying attention log write: {e}")
+                    continue
+                raise
+    
+    def _write_rows(self, rows: List[tuple]):
+        """Insert rows into attention_log in a single write transaction"""
+        if self._conn is None:
+            self._conn = self._open_db()
+        
+        # IMMEDIATE takes the write lock up front, so a busy database makes
+        # BEGIN wait rather than failing midway through the batch
+        self._conn.execute("BEGIN IMMEDIATE")
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO attention_log (
-                    session_id, timestamp, state, score, confidence,
-                    trend, signals_json, capabilities_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                attention_data['session_id'],
-                attention_data['timestamp'],
-                attention_data['state'],
-                attention_data['score'],
-                attention_data['confidence'],
-                attention_data['trend'],
-                json.dumps(attention_data['signals']),
-                json.dumps(attention_data['capabilities'])
-            ))
-            
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            logger.debug(f"Error logging attention: {e}")
+            self._conn.executemany(ATTENTION_INSERT_SQL, rows)
+            self._conn.execute("COMMIT")
+        except Exception:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
     
     def get_recommendations(self, attention_data: Dict) -> List[str]:
         """Generate recommendations based on attention state"""
@@ -427,28 +836,72 @@ class AttentionMonitorDaemon:
                     recommendations = self.get_recommendations(attention_data)
                     
                     # Log state changes
-                    if attention_data['state'] != self.last_state:
+                    if attention_data['state_changed']:
                         logger.info(
                             f"🔄 Attention state: {attention_data['state']} "
                             f"(score: {attention_data['score']:.1f}, "
                             f"confidence: {attention_data['confidence']:.2f})"
                         )
                     
+                    # Nobody there: double the wait (up to 16x) until input returns
+                    if attention_data['state'] == "INACTIVE":
+                        self._current_interval = min(
+                            self.interval * 16, self._current_interval * 2
+                        )
+                    else:
+                        self._current_interval = self.interval
+                    
                     # Sleep before next check
-                    time.sleep(self.interval)
+                    self._sleep(self._current_interval)
                     
                 except Exception as e:
                     logger.error(f"Error in attention monitoring loop: {e}")
-                    time.sleep(self.interval)
+                    self._sleep(self.interval)
         
         except KeyboardInterrupt:
             logger.info("Attention monitor interrupted")
         finally:
             self.stop()
     
+    def _sleep(self, seconds: float):
+        """Wait between samples; returns early on user input or stop()"""
+        self._wake.wait(seconds)
+        self._wake.clear()
+    
     def stop(self):
         """Stop the daemon"""
         self.running = False
+        self._wake.set()
+        
+        try:
+            self._flush_pending()
+        except Exception as e:
+            logger.error(f"Error logging final attention events: {e}")
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        
+        for listener in (self.keyboard_listener, self.mouse_listener):
+            if listener:
+                listener.stop()
+        
+        if self.audio_stream:
+            try:
+                self.audio_stream.stop_stream()
+                self.audio_stream.close()
+            except Exception:
+                pass
+            self.audio_stream = None
+        
+        if self.window_tracker:
+            self.window_tracker.stop()
+        
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        if self.camera_grabber:
+            self.camera_grabber.stop()
         
         if self.camera:
             try:
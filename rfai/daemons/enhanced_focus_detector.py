@@ -4,14 +4,18 @@ Uses multimodal signals including camera pose/gaze detection
 """
 
 import time
-import json
-import uuid
 import logging
 import platform
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict
-import sqlite3
+from typing import Optional, Dict, Tuple
+import queue
+import sys
+import threading
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from rfai.daemons.focus_detector import HAS_PSUTIL, HAS_PYNPUT, FocusStateWriter, psutil
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +64,9 @@ class EnhancedFocusDetector:
         self.last_state = "INACTIVE"
         self.state_duration = 0
         
+        # Batched focus_states writes over one long-lived connection
+        self._writer = FocusStateWriter(db_path)
+        
         logger.info(f"Enhanced Focus Detector initialized on {self.platform}")
         logger.info(f"Camera: {use_camera}, Microphone: {use_microphone}")
         
@@ -69,41 +76,50 @@ class EnhancedFocusDetector:
         # Setup camera if enabled
         if use_camera:
             self._setup_camera()
+        
+        # The set of signals is fixed once setup is done, so the getters to
+        # call and each signal's share of the total weight are decided here
+        getters = {
+            'keyboard': self._get_keyboard_signal,
+            'mouse': self._get_mouse_signal,
+            'window': self._get_window_signal,
+            'cpu': self._get_cpu_signal
+        }
+        self._signal_getters = tuple(
+            (key, getter) for key, getter in getters.items() if self.capabilities.get(key)
+        )
+        self._vision_enabled = bool(self.use_camera and self.capabilities.get('camera'))
+        
+        enabled = [key for key, _ in self._signal_getters]
+        if self._vision_enabled:
+            enabled += ['pose', 'gaze']
+        total_weight = sum(self.weights[key] for key in enabled)
+        self._signal_weights = tuple(
+            (key, self.weights[key] / total_weight) for key in enabled
+        )
     
     def _setup_monitoring(self):
         """Setup available monitoring capabilities"""
         self.capabilities = {
-            'keyboard': False,
-            'mouse': False,
+            'keyboard': HAS_PYNPUT,
+            'mouse': HAS_PYNPUT,
             'camera': False,
             'microphone': False,
-            'window': False,
-            'cpu': False
+            # Window monitoring depends on platform
+            'window': self.platform in ["Darwin", "Linux", "Windows"],
+            'cpu': HAS_PSUTIL
         }
+        self.keyboard_listener = None
+        self.mouse_listener = None
         
-        # Try keyboard/mouse monitoring
-        try:
-            from pynput import keyboard, mouse
-            self.keyboard_listener = None
-            self.mouse_listener = None
-            self.capabilities['keyboard'] = True
-            self.capabilities['mouse'] = True
-            logger.info("pynput available for keyboard/mouse monitoring")
-        except ImportError:
+        if not HAS_PYNPUT:
             logger.warning("pynput not available - install for better focus detection")
-        
-        # Try CPU monitoring
-        try:
-            import psutil
-            self.capabilities['cpu'] = True
-            logger.info("psutil available for CPU monitoring")
-        except ImportError:
+        if HAS_PSUTIL:
+            # Baseline for the non-blocking reads in _get_cpu_signal
+            psutil.cpu_percent(interval=None)
+        else:
             logger.warning("psutil not available")
         
-        # Window monitoring depends on platform
-        if self.platform in ["Darwin", "Linux", "Windows"]:
-            self.capabilities['window'] = True
-        
         logger.info(f"Capabilities: {sum(self.capabilities.values())}/6 signals available")
     
     def _setup_camera(self):
@@ -118,24 +134,47 @@ class EnhancedFocusDetector:
             # Initialize MediaPipe
             self.mp_pose = mp.solutions.pose
             self.mp_face_mesh = mp.solutions.face_mesh
+            # Plain list indices, so scoring skips the enum lookups per frame
+            self._shoulder_indices = (
+                int(self.mp_pose.PoseLandmark.LEFT_SHOULDER),
+                int(self.mp_pose.PoseLandmark.RIGHT_SHOULDER)
+            )
             
+            # Lite pose model: only shoulder levels are read, which the
+            # lightest model locates well enough at a fraction of the cost.
+            # Video mode lets both graphs track landmarks from the previous
+            # frame instead of re-running detection when the user stays put
             self.pose = self.mp_pose.Pose(
+                static_image_mode=False,
+                model_complexity=0,
+                enable_segmentation=False,
                 min_detection_confidence=0.5,
                 min_tracking_confidence=0.5
             )
             
+            # One face, no iris refinement: gaze only uses the nose tip
             self.face_mesh = self.mp_face_mesh.FaceMesh(
+                static_image_mode=False,
+                max_num_faces=1,
+                refine_landmarks=False,
                 min_detection_confidence=0.5,
                 min_tracking_confidence=0.5
             )
             
             # Try to open camera
             self.camera = cv2.VideoCapture(0)
+            # Keep only the newest frame queued, and capture at 640x480:
+            # shoulder and nose landmarks don't need HD input to MediaPipe
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
             if self.camera.isOpened():
                 self.capabilities['camera'] = True
+                self._start_camera_pipeline()
                 logger.info("✓ Camera initialized with MediaPipe")
             else:
                 logger.warning("Camera not accessible")
+                self.camera.release()
                 self.use_camera = False
         
         except ImportError as e:
@@ -146,91 +185,120 @@ class EnhancedFocusDetector:
             logger.error(f"Camera setup failed: {e}")
             self.use_camera = False
     
-    def _get_pose_signal(self) -> float:
-        """
-        Get body pose signal from camera
-        Returns 0.0 (distracted) to 1.0 (focused)
+    def _start_camera_pipeline(self):
         """
-        if not self.use_camera or not self.capabilities.get('camera'):
-            return 0.5  # Neutral
+        Start the capture and inference threads
         
-        try:
-            # Capture frame
-            ret, frame = self.camera.read()
-            if not ret:
-                return 0.5
-            
-            # Convert to RGB
-            frame_rgb = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
-            
-            # Process pose
-            results = self.pose.process(frame_rgb)
-            
-            if not results.pose_landmarks:
-                return 0.3  # No person detected
+        The capture thread keeps the driver's buffer drained and hands one
+        fresh frame per interval to the inference thread through a size-1
+        queue; the inference thread runs pose and face mesh on that single
+        frame and publishes both scores for the daemon tick to read.
+        """
+        self._camera_scores = (0.5, 0.5)  # (pose, gaze), replaced as one tuple
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._camera_stop = threading.Event()
+        self._camera_threads = [
+            threading.Thread(target=self._capture_loop, name="focus-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="focus-inference", daemon=True)
+        ]
+        for thread in self._camera_threads:
+            thread.start()
+    
+    def _stop_camera_pipeline(self):
+        """Stop the camera threads and release the device"""
+        self._camera_stop.set()
+        for thread in self._camera_threads:
+            thread.join(timeout=2.0)
+        self.camera.release()
+    
+    def _capture_loop(self):
+        next_sample = 0.0
+        while not self._camera_stop.is_set():
+            # grab() paces the loop at the camera's frame rate without decoding
+            if not self.camera.grab():
+                self._camera_stop.wait(0.1)
+                continue
             
-            # Analyze posture
-            landmarks = results.pose_landmarks.landmark
+            now = time.monotonic()
+            if now < next_sample:
+                continue
+            ok, frame = self.camera.retrieve()
+            if not ok:
+                continue
+            next_sample = now + self.interval
             
-            # Check if sitting upright (shoulders level)
-            left_shoulder = landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-            right_shoulder = landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
+            # Replace a frame the inference thread hasn't picked up yet
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_queue.put_nowait(frame)
+    
+    def _inference_loop(self):
+        while not self._camera_stop.is_set():
+            try:
+                frame = self._frame_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
             
-            shoulder_diff = abs(left_shoulder.y - right_shoulder.y)
+            try:
+                # Convert to RGB once for both models
+                frame_rgb = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
+                pose_score = self._score_pose(self.pose.process(frame_rgb))
+                gaze_score = self._score_gaze(self.face_mesh.process(frame_rgb))
+            except Exception as e:
+                logger.debug(f"Camera inference error: {e}")
+                pose_score = gaze_score = 0.5
             
-            # Good posture if shoulders are level (< 0.05 difference)
-            if shoulder_diff < 0.05:
-                return 0.9  # Focused posture
-            elif shoulder_diff < 0.1:
-                return 0.7  # Okay posture
-            else:
-                return 0.4  # Poor posture (distracted)
-        
-        except Exception as e:
-            logger.debug(f"Pose detection error: {e}")
-            return 0.5
+            self._camera_scores = (pose_score, gaze_score)
+    
+    def _score_pose(self, results) -> float:
+        """Map MediaPipe pose results to a 0.0 (distracted) - 1.0 (focused) score"""
+        if not results.pose_landmarks:
+            return 0.3  # No person detected
+        
+        # Analyze posture
+        landmarks = results.pose_landmarks.landmark
+        
+        # Check if sitting upright (shoulders level)
+        left, right = self._shoulder_indices
+        shoulder_diff = abs(landmarks[left].y - landmarks[right].y)
+        
+        # Good posture if shoulders are level (< 0.05 difference)
+        if shoulder_diff < 0.05:
+            return 0.9  # Focused posture
+        elif shoulder_diff < 0.1:
+            return 0.7  # Okay posture
+        else:
+            return 0.4  # Poor posture (distracted)
+    
+    def _score_gaze(self, results) -> float:
+        """Map MediaPipe face mesh results to a 0.0 (away) - 1.0 (at screen) score"""
+        if not results.multi_face_landmarks:
+            return 0.3  # No face detected
+        
+        # Analyze gaze (simplified - check if face is centered)
+        # using the nose tip (landmark 1)
+        nose = results.multi_face_landmarks[0].landmark[1]
+        
+        # Check if nose is centered (0.4-0.6 range horizontally)
+        if 0.4 <= nose.x <= 0.6 and 0.4 <= nose.y <= 0.6:
+            return 0.9  # Looking at screen
+        elif 0.3 <= nose.x <= 0.7:
+            return 0.6  # Slightly off-center
+        else:
+            return 0.3  # Looking away
     
-    def _get_gaze_signal(self) -> float:
+    def _get_vision_signals(self) -> Tuple[float, float]:
         """
-        Get gaze direction signal from camera
-        Returns 0.0 (looking away) to 1.0 (looking at screen)
+        Get (pose, gaze) signals from the camera, both scored on one frame
+        Pose: 0.0 (distracted) to 1.0 (focused)
+        Gaze: 0.0 (looking away) to 1.0 (looking at screen)
         """
         if not self.use_camera or not self.capabilities.get('camera'):
-            return 0.5  # Neutral
-        
-        try:
-            # Capture frame
-            ret, frame = self.camera.read()
-            if not ret:
-                return 0.5
-            
-            # Convert to RGB
-            frame_rgb = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
-            
-            # Process face mesh
-            results = self.face_mesh.process(frame_rgb)
-            
-            if not results.multi_face_landmarks:
-                return 0.3  # No face detected
-            
-            # Analyze gaze (simplified - check if face is centered)
-            face_landmarks = results.multi_face_landmarks[0]
-            landmarks = face_landmarks.landmark
-            
-            # Get nose tip (landmark 1)
-            nose = landmarks[1]
-            
-            # Check if nose is centered (0.4-0.6 range horizontally)
-            if 0.4 <= nose.x <= 0.6 and 0.4 <= nose.y <= 0.6:
-                return 0.9  # Looking at screen
-            elif 0.3 <= nose.x <= 0.7:
-                return 0.6  # Slightly off-center
-            else:
-                return 0.3  # Looking away
+            return 0.5, 0.5  # Neutral
         
-        except Exception as e:
-            logger.debug(f"Gaze detection error: {e}")
-            return 0.5
+        return self._camera_scores
     
     def compute_focus_score(self) -> Dict[str, any]:
         """
@@ -239,31 +307,18 @@ class EnhancedFocusDetector:
         Returns:
             Dict with state, confidence, and signal breakdown
         """
-        signals = {}
-        
         # Get all available signals
-        if self.capabilities.get('keyboard'):
-            signals['keyboard'] = self._get_keyboard_signal()
-        
-        if self.capabilities.get('mouse'):
-            signals['mouse'] = self._get_mouse_signal()
-        
-        if self.capabilities.get('window'):
-            signals['window'] = self._get_window_signal()
-        
-        if self.capabilities.get('cpu'):
-            signals['cpu'] = self._get_cpu_signal()
-        
-        if self.use_camera and self.capabilities.get('camera'):
-            signals['pose'] = self._get_pose_signal()
-            signals['gaze'] = self._get_gaze_signal()
-        
-        # Compute weighted score
-        total_weight = sum(self.weights.get(k, 0) for k in signals.keys())
-        composite_score = sum(
-            self.weights.get(key, 0) * value
-            for key, value in signals.items()
-        ) / total_weight if total_weight > 0 else 0.5
+        signals = {key: getter() for key, getter in self._signal_getters}
+        if self._vision_enabled:
+            signals['pose'], signals['gaze'] = self._get_vision_signals()
+        
+        # Compute weighted score (neutral when no signal is available)
+        if self._signal_weights:
+            composite_score = 0.0
+            for key, weight in self._signal_weights:
+                composite_score += weight * signals[key]
+        else:
+            composite_score = 0.5
         
         # Scale to 0-100
         composite_score = composite_score * 100
@@ -314,45 +369,19 @@ class EnhancedFocusDetector:
     
     def _get_cpu_signal(self) -> float:
         """CPU usage signal"""
-        try:
-            import psutil
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            if cpu_percent < 20:
-                return 0.3
-            elif cpu_percent < 80:
-                return 0.7
-            else:
-                return 0.9
-        except:
-            return 0.5
+        # Usage since the previous tick
+        cpu_percent = psutil.cpu_percent(interval=None)
+        if cpu_percent < 20:
+            return 0.3
+        elif cpu_percent < 80:
+            return 0.7
+        else:
+            return 0.9
     
     def log_focus_state(self, focus_data: Dict):
-        """Log focus state to database"""
-        state_id = str(uuid.uuid4())
-        timestamp = datetime.now()
-        
-        try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO focus_states (
-                    id, timestamp, state, confidence, signal_breakdown
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
-                state_id,
-                timestamp,
-                focus_data['state'],
-                focus_data['confidence'],
-                json.dumps(focus_data['signals'])
-            ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.debug(f"Focus: {focus_data['state']} ({focus_data['confidence']:.2f})")
-        except Exception as e:
-            logger.error(f"Error logging focus state: {e}")
+        """Queue focus state for the next batched write to the database"""
+        self._writer.log(focus_data)
+        logger.debug(f"Focus: {focus_data['state']} ({focus_data['confidence']:.2f})")
     
     def run(self):
         """Main daemon loop"""
@@ -361,6 +390,9 @@ class EnhancedFocusDetector:
         logger.info(f"Signals: {sum(self.capabilities.values())}/6")
         
         try:
+            # Ticks are scheduled against absolute deadlines so the time spent
+            # scoring and logging doesn't stretch the period
+            next_tick = time.monotonic()
             while self.running:
                 # Compute focus score
                 focus_data = self.compute_focus_score()
@@ -368,8 +400,14 @@ class EnhancedFocusDetector:
                 # Log to database
                 self.log_focus_state(focus_data)
                 
-                # Sleep until next check
-                time.sleep(self.interval)
+                # Sleep until next check; after an overrun, skip the missed
+                # ticks rather than running them back to back
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.monotonic()
         
         except KeyboardInterrupt:
             logger.info("Enhanced Focus Detector stopped by user")
@@ -377,13 +415,16 @@ class EnhancedFocusDetector:
             logger.error(f"Enhanced Focus Detector error: {e}")
         finally:
             self.running = False
-            if self.use_camera and hasattr(self, 'camera'):
-                self.camera.release()
+            if self.capabilities.get('camera'):
+                self._stop_camera_pipeline()
+            self._writer.close()
             logger.info("Enhanced Focus Detector shutdown")
     
     def stop(self):
         """Stop the daemon"""
         self.running = False
+        # The loop may be mid-sleep when the process exits; don't lose the batch
+        self._writer.flush()
 
 
 if __name__ == "__main__":
@@ -12,9 +12,127 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict
 import sqlite3
+import threading
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Input and system probes run once per process; EnhancedFocusDetector reuses them
+try:
+    from pynput import keyboard, mouse  # noqa: F401 (availability probe)
+    HAS_PYNPUT = True
+except ImportError:
+    HAS_PYNPUT = False
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAS_PSUTIL = False
 
 logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    def dumps_json(obj):
+        """Serialize obj to a JSON string for a TEXT column"""
+        return orjson.dumps(obj).decode()
+else:
+    dumps_json = json.dumps
+
+# Samples buffered before a batched insert (5 min at the default 30s interval);
+# state changes are written straight away
+FOCUS_FLUSH_ROWS = 10
+
+# One statement string for every write, so the connection's statement cache
+# reuses the compiled INSERT
+FOCUS_INSERT_SQL = """
+    INSERT INTO focus_states (
+        id, timestamp, state, confidence, signal_breakdown
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+
+class FocusStateWriter:
+    """
+    Batched focus_states writer over one long-lived connection
+    
+    Shared by FocusDetectorDaemon and EnhancedFocusDetector. Samples are
+    buffered and written FOCUS_FLUSH_ROWS at a time, except that a change of
+    state is written immediately (readers take the newest row as current).
+    """
+    
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._pending_rows = []
+        self._last_logged_state = None
+        self._lock = threading.Lock()
+        self._conn = self._open_db()
+    
+    def _open_db(self):
+        """Open the long-lived connection (autocommit)"""
+        conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Wait out other daemons' write locks instead of failing the insert
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+    
+    def log(self, focus_data: Dict):
+        """Queue one focus sample, flushing on a full batch or a state change"""
+        state = focus_data['state']
+        row = (
+            str(uuid.uuid4()),
+            datetime.now(),
+            state,
+            focus_data['confidence'],
+            dumps_json(focus_data['signals'])
+        )
+        with self._lock:
+            self._pending_rows.append(row)
+            flush = (len(self._pending_rows) >= FOCUS_FLUSH_ROWS
+                     or state != self._last_logged_state)
+            self._last_logged_state = state
+        
+        if flush:
+            self.flush()
+    
+    def flush(self):
+        """Write all queued focus states in one transaction"""
+        with self._lock:
+            if not self._pending_rows:
+                return
+            
+            rows = self._pending_rows
+            self._pending_rows = []
+            try:
+                if self._conn is None:
+                    self._conn = self._open_db()
+                
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(FOCUS_INSERT_SQL, rows)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            except Exception as e:
+                logger.error(f"Error logging {len(rows)} focus states: {e}")
+    
+    def close(self):
+        """Flush what is queued and close the connection"""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 class FocusDetectorDaemon:
     """
@@ -49,11 +167,18 @@ class FocusDetectorDaemon:
             'window': 0.25,    # Window stability
             'cpu': 0.20        # CPU usage patterns
         }
+        total_weight = sum(self.weights.values())
+        self._normalized_weights = {
+            key: weight / total_weight for key, weight in self.weights.items()
+        }
         
         # Track last state for smoothing
         self.last_state = "INACTIVE"
         self.state_duration = 0
         
+        # Batched focus_states writes over one long-lived connection
+        self._writer = FocusStateWriter(db_path)
+        
         logger.info(f"Focus Detector initialized on {self.platform}")
         logger.info(f"Check interval: {self.interval}s")
         
@@ -63,37 +188,26 @@ class FocusDetectorDaemon:
     def _setup_monitoring(self):
         """Setup available monitoring capabilities"""
         self.capabilities = {
-            'keyboard': False,
-            'mouse': False,
+            'keyboard': HAS_PYNPUT,
+            'mouse': HAS_PYNPUT,
             'camera': False,
             'microphone': False,
-            'window': False,
-            'cpu': False
+            # Window monitoring depends on platform
+            'window': self.platform in ["Darwin", "Linux", "Windows"],
+            'cpu': HAS_PSUTIL
         }
+        self.keyboard_listener = None
+        self.mouse_listener = None
         
-        # Try keyboard/mouse monitoring
-        try:
-            from pynput import keyboard, mouse
-            self.keyboard_listener = None
-            self.mouse_listener = None
-            self.capabilities['keyboard'] = True
-            self.capabilities['mouse'] = True
-            logger.info("pynput available for keyboard/mouse monitoring")
-        except ImportError:
+        if not HAS_PYNPUT:
             logger.warning("pynput not available - install for better focus detection")
-        
-        # Try CPU monitoring
-        try:
-            import psutil
-            self.capabilities['cpu'] = True
-            logger.info("psutil available for CPU monitoring")
-        except ImportError:
+        if HAS_PSUTIL:
+            # Prime the CPU counters: later interval=None calls return usage
+            # since the previous call instead of sleeping to measure it
+            psutil.cpu_percent(interval=None)
+        else:
             logger.warning("psutil not available - install for CPU-based focus hints")
         
-        # Window monitoring depends on platform
-        if self.platform in ["Darwin", "Linux", "Windows"]:
-            self.capabilities['window'] = True
-        
         logger.info(f"Capabilities: {sum(self.capabilities.values())}/6 signals available")
     
     def compute_focus_score(self) -> Dict[str, any]:
@@ -126,14 +240,14 @@ class FocusDetectorDaemon:
         else:
             signals['cpu'] = 0.5
         
-        # Compute weighted score
-        composite_score = sum(
-            self.weights.get(key, 0) * value
-            for key, value in signals.items()
-        ) / sum(self.weights.values())
-        
-        # Scale to 0-100
-        composite_score = composite_score * 100
+        # Compute weighted score, scaled to 0-100
+        w = self._normalized_weights
+        composite_score = (
+            w['keyboard'] * signals['keyboard']
+            + w['mouse'] * signals['mouse']
+            + w['window'] * signals['window']
+            + w['cpu'] * signals['cpu']
+        ) * 100.0
         
         # Classify state
         if composite_score >= 75:
@@ -199,46 +313,20 @@ class FocusDetectorDaemon:
         Get CPU usage signal
         High CPU might indicate active work (compiling, rendering, etc.)
         """
-        try:
-            import psutil
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            # Normalize: 0-20% CPU = low activity, 20-80% = active, >80% = very active
-            if cpu_percent < 20:
-                return 0.3
-            elif cpu_percent < 80:
-                return 0.7
-            else:
-                return 0.9
-        except Exception:
-            return 0.5
+        # Usage since the previous tick
+        cpu_percent = psutil.cpu_percent(interval=None)
+        # Normalize: 0-20% CPU = low activity, 20-80% = active, >80% = very active
+        if cpu_percent < 20:
+            return 0.3
+        elif cpu_percent < 80:
+            return 0.7
+        else:
+            return 0.9
     
     def log_focus_state(self, focus_data: Dict):
-        """Log focus state to database"""
-        state_id = str(uuid.uuid4())
-        timestamp = datetime.now()
-        
-        try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO focus_states (
-                    id, timestamp, state, confidence, signal_breakdown
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
-                state_id,
-                timestamp,
-                focus_data['state'],
-                focus_data['confidence'],
-                json.dumps(focus_data['signals'])
-            ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.debug(f"Focus state: {focus_data['state']} ({focus_data['confidence']:.2f})")
-        except Exception as e:
-            logger.error(f"Error logging focus state: {e}")
+        """Queue focus state for the next batched write to the database"""
+        self._writer.log(focus_data)
+        logger.debug(f"Focus state: {focus_data['state']} ({focus_data['confidence']:.2f})")
     
     def run(self):
         """Main daemon loop"""
@@ -247,6 +335,9 @@ class FocusDetectorDaemon:
         logger.info(f"Available signals: {sum(self.capabilities.values())}/6")
         
         try:
+            # Ticks are scheduled against absolute deadlines so the time spent
+            # scoring and logging doesn't stretch the period
+            next_tick = time.monotonic()
             while self.running:
                 # Compute focus score
                 focus_data = self.compute_focus_score()
@@ -254,8 +345,14 @@ class FocusDetectorDaemon:
                 # Log to database
                 self.log_focus_state(focus_data)
                 
-                # Sleep until next check
-                time.sleep(self.interval)
+                # Sleep until next check; after an overrun, skip the missed
+                # ticks rather than running them back to back
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.monotonic()
         
         except KeyboardInterrupt:
             logger.info("Focus Detector daemon stopped by user")
@@ -263,11 +360,14 @@ class FocusDetectorDaemon:
             logger.error(f"Focus Detector daemon error: {e}")
         finally:
             self.running = False
+            self._writer.close()
             logger.info("Focus Detector daemon shutdown")
     
     def stop(self):
         """Stop the daemon"""
         self.running = False
+        # The loop may be mid-sleep when the process exits; don't lose the batch
+        self._writer.flush()
 
 
 if __name__ == "__main__":
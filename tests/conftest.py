@@ -0,0 +1,27 @@
+"""
+Shared pytest setup: make the repository root importable and provide an API
+app backed by a throwaway database
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """API app whose ~/.rfai data directory lives in a temporary home"""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    from rfai.api.server import create_app
+    app = create_app()
+    app.config['TESTING'] = True
+    yield app
+    app.activity_writer.close()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,48 @@
+"""
+Tests for attention state classification
+"""
+
+import numpy as np
+import pytest
+
+from database.init_db import init_database
+from rfai.daemons.attention_monitor import AttentionMonitorDaemon
+
+# Every threshold, a hair either side of it, and the ends of the scale
+BOUNDARY_SCORES = [
+    0.0, 29.999, 30.0, 30.001, 54.999, 55.0, 55.001,
+    74.999, 75.0, 75.001, 100.0, np.nextafter(30.0, 0), np.nextafter(75.0, 100),
+]
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    db_path = tmp_path / "rfai.db"
+    init_database(db_path)
+    monitor = AttentionMonitorDaemon(db_path=db_path)
+    yield monitor
+    monitor.stop()
+
+
+def test_batch_matches_scalar_on_boundaries(monitor):
+    expected = [monitor.classify_state(score) for score in BOUNDARY_SCORES]
+    assert monitor.classify_state_batch(BOUNDARY_SCORES).tolist() == expected
+
+
+def test_batch_matches_scalar_across_the_range(monitor):
+    scores = np.linspace(-5.0, 105.0, 2201)
+    expected = [monitor.classify_state(score) for score in scores]
+    assert monitor.classify_state_batch(scores).tolist() == expected
+
+
+@pytest.mark.parametrize("score, state", [
+    (0.0, "INACTIVE"),
+    (29.9, "INACTIVE"),
+    (30.0, "DISTRACTED"),
+    (55.0, "ACTIVE"),
+    (75.0, "FOCUSED"),
+    (100.0, "FOCUSED"),
+])
+def test_threshold_equal_to_bound_lands_in_higher_state(monitor, score, state):
+    assert monitor.classify_state(score) == state
+    assert monitor.classify_state_batch([score]).tolist() == [state]
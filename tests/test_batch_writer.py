@@ -0,0 +1,112 @@
+"""
+Tests for the background batched write queue
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from rfai.api.batch_writer import BatchWriter
+
+INSERT_A = "INSERT INTO a (n) VALUES (?)"
+INSERT_B = "INSERT INTO b (n) VALUES (?)"
+
+
+class CountingConnection(sqlite3.Connection):
+    """Connection that records every commit in a list shared by the test"""
+
+    commits = None
+
+    def commit(self):
+        super().commit()
+        self.commits.append(1)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "queue.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE a (n INTEGER)")
+        conn.execute("CREATE TABLE b (n INTEGER)")
+    return path
+
+
+@pytest.fixture
+def commits():
+    CountingConnection.commits = []
+    yield CountingConnection.commits
+    CountingConnection.commits = None
+
+
+def make_writer(db_path, **kwargs):
+    return BatchWriter(
+        lambda: sqlite3.connect(db_path, factory=CountingConnection), **kwargs
+    )
+
+
+def rows(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return [n for (n,) in conn.execute(f"SELECT n FROM {table} ORDER BY rowid")]
+
+
+def test_interleaved_statements_land_in_submission_order(db_path, commits):
+    writer = make_writer(db_path, flush_interval=10)
+    for n in range(20):
+        writer.submit(INSERT_A if n % 2 == 0 else INSERT_B, (n,))
+    writer.close()
+
+    assert rows(db_path, 'a') == list(range(0, 20, 2))
+    assert rows(db_path, 'b') == list(range(1, 20, 2))
+    # Everything fits in one batch, so one transaction
+    assert len(commits) == 1
+
+
+def test_full_batch_commits_once_per_flush(db_path, commits):
+    writer = make_writer(db_path, flush_interval=10, max_batch=3)
+    for n in range(7):
+        writer.submit(INSERT_A, (n,))
+    writer.close()
+
+    assert rows(db_path, 'a') == list(range(7))
+    # Two full batches, then the remainder drained on shutdown
+    assert len(commits) == 3
+
+
+def test_flush_interval_commits_without_shutdown(db_path, commits):
+    writer = make_writer(db_path, flush_interval=0.05)
+    writer.submit(INSERT_A, (1,))
+
+    deadline = time.perf_counter() + 2
+    while not commits and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert rows(db_path, 'a') == [1]
+    writer.close()
+
+
+def test_close_drains_queue_and_stops_worker(db_path, commits):
+    writer = make_writer(db_path, flush_interval=10, max_batch=1000)
+    for n in range(250):
+        writer.submit(INSERT_A, (n,))
+    writer.close()
+
+    assert rows(db_path, 'a') == list(range(250))
+    assert not writer._thread.is_alive()
+
+
+def test_close_before_first_submit_is_a_no_op(db_path):
+    writer = make_writer(db_path)
+    writer.close()
+    assert writer._thread is None
+
+
+def test_failed_batch_is_rolled_back_and_worker_keeps_running(db_path, commits):
+    writer = make_writer(db_path, flush_interval=10, max_batch=2)
+    writer.submit(INSERT_A, (1,))
+    writer.submit("INSERT INTO missing (n) VALUES (?)", (2,))
+    writer.submit(INSERT_A, (3,))
+    writer.close()
+
+    # The first batch fails as a whole; the next one still lands
+    assert rows(db_path, 'a') == [3]
+    assert len(commits) == 1
@@ -0,0 +1,171 @@
+"""
+Tests for the stale-while-revalidate response cache
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from rfai.api import cache as cache_module
+from rfai.api.cache import SWRCache, swr_cached
+
+
+class FakeClock:
+    """Stand-in for time.monotonic() that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # Only the cache module sees the fake clock, not threading or pytest
+    monkeypatch.setattr(cache_module, 'time', SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true; background refreshes run on real threads"""
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise AssertionError("condition not reached before timeout")
+        time.sleep(0.005)
+
+
+class Counter:
+    """compute() callable returning 1, 2, 3, ... and optionally blocking"""
+
+    def __init__(self, gate=None):
+        self.calls = 0
+        self.gate = gate
+
+    def __call__(self):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        return self.calls
+
+
+def test_fresh_hit_does_not_recompute(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100)
+    compute = Counter()
+
+    assert cache.get('k', compute) == 1
+    clock.advance(9.9)
+    assert cache.get('k', compute) == 1
+    assert compute.calls == 1
+
+
+def test_stale_entry_is_served_while_refreshing(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100)
+    assert cache.get('k', lambda: 'old') == 'old'
+
+    gate = threading.Event()
+    compute = Counter(gate)
+    clock.advance(10)
+
+    # Served immediately; only one refresh starts however often it is asked
+    assert cache.get('k', compute) == 'old'
+    assert cache.get('k', compute) == 'old'
+    wait_for(lambda: compute.calls == 1)
+
+    gate.set()
+    wait_for(lambda: cache.get('k', compute) == 1)
+    assert compute.calls == 1
+
+
+def test_entry_past_stale_ttl_is_recomputed_synchronously(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100)
+    compute = Counter()
+
+    assert cache.get('k', compute) == 1
+    clock.advance(100)
+    assert cache.get('k', compute) == 2
+    assert compute.calls == 2
+
+
+def test_stale_ttl_never_shorter_than_ttl():
+    cache = SWRCache(ttl=30, stale_ttl=5)
+    assert cache.stale_ttl == 30
+
+
+def test_failed_refresh_keeps_serving_and_retries(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100)
+    cache.get('k', lambda: 'old')
+    clock.advance(10)
+
+    attempts = []
+
+    def failing():
+        attempts.append(1)
+        raise RuntimeError("backend down")
+
+    assert cache.get('k', failing) == 'old'
+    wait_for(lambda: attempts and not cache._entries['k'][3])
+
+    # The stale value survives the failure and the next request tries again
+    compute = Counter()
+    assert cache.get('k', compute) == 'old'
+    wait_for(lambda: cache.get('k', compute) == 1)
+    assert len(attempts) == 1
+
+
+def test_synchronous_compute_errors_propagate_and_are_not_cached(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get('k', failing)
+    assert cache.get('k', lambda: 'ok') == 'ok'
+
+
+def test_invalidate_one_key_or_all(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100)
+    cache.get('a', lambda: 1)
+    cache.get('b', lambda: 1)
+
+    cache.invalidate('a')
+    assert cache.get('a', lambda: 2) == 2
+    assert cache.get('b', lambda: 2) == 1
+
+    cache.invalidate()
+    assert cache.get('b', lambda: 3) == 3
+
+
+def test_swr_cached_keys_on_positional_arguments(clock):
+    calls = []
+
+    @swr_cached(ttl=10, stale_ttl=100)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(4) == 16
+    assert calls == [3, 4]
+    assert ('square', 3) in square.cache._entries
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = SWRCache(ttl=10, stale_ttl=100, maxsize=2)
+    cache.get('a', lambda: 'a1')
+    cache.get('b', lambda: 'b1')
+    cache.get('a', lambda: 'a2')  # Hit: 'a' becomes most recently used
+
+    cache.get('c', lambda: 'c1')
+    assert list(cache._entries) == ['a', 'c']
+    assert cache.get('b', lambda: 'b2') == 'b2'
+    assert len(cache._entries) == 2
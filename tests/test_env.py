@@ -0,0 +1,115 @@
+"""
+Tests for the `.env` parser and loader
+"""
+
+import pytest
+
+from rfai.config import env
+from rfai.config.env import _iter_env_pairs, load_env
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("KEY=value", [("KEY", "value")]),
+    ("KEY = value  # comment", [("KEY", "value")]),
+    ("\tKEY\t=\tvalue\t", [("KEY", "value")]),
+    ('KEY="quoted value"', [("KEY", "quoted value")]),
+    ("KEY = 'single quoted'  ", [("KEY", "single quoted")]),
+    ("KEY='mismatched\"", [("KEY", "'mismatched\"")]),
+    ("export KEY=value", [("KEY", "value")]),
+    ("export  KEY = value", [("KEY", "value")]),
+    ("export=value", [("export", "value")]),
+    ("KEY=value\r", [("KEY", "value")]),
+    ("KEY=héllo wörld", [("KEY", "héllo wörld")]),
+    ("KEY=a=b", [("KEY", "a=b")]),
+    ("KEY=", [("KEY", "")]),
+    ("KEY=#only a comment", [("KEY", "")]),
+    ("gemini = abc", [("gemini", "abc")]),
+    ("", []),
+    ("   ", []),
+    ("# KEY=value", []),
+    ("  # KEY=value", []),
+    ("=value", []),
+    ("NO_ASSIGNMENT", []),
+    ("KEY # =value", []),
+])
+def test_parse_single_line(line, expected):
+    assert list(_iter_env_pairs(line.encode("utf-8"))) == expected
+
+
+def test_parse_file_keeps_order_across_crlf_lines():
+    raw = (
+        "# header\r\n"
+        "\r\n"
+        "FIRST=1\r\n"
+        "export SECOND = 'two'  # note\r\n"
+        "THIRD=drei\r\n"
+    ).encode("utf-8")
+    assert list(_iter_env_pairs(raw)) == [
+        ("FIRST", "1"), ("SECOND", "two"), ("THIRD", "drei"),
+    ]
+
+
+def test_undecodable_bytes_are_dropped():
+    assert list(_iter_env_pairs(b"KEY=ab\xffc\n")) == [("KEY", "abc")]
+
+
+@pytest.fixture
+def dotenv(tmp_path, monkeypatch):
+    """Point the loader at a temporary `.env` and undo its os.environ writes"""
+    path = tmp_path / ".env"
+    monkeypatch.setenv("RFAI_ENV_FILE", str(path))
+    for name in ("youtube", "YOUTUBE_API_KEY", "RFAI_TEST_VALUE"):
+        monkeypatch.delenv(name, raising=False)
+    load_env.cache_clear()
+    env._search_dotenv.cache_clear()
+    yield path
+    load_env.cache_clear()
+    env._search_dotenv.cache_clear()
+
+
+def test_load_env_normalizes_informal_keys(dotenv):
+    dotenv.write_text("youtube = abc123\nRFAI_TEST_VALUE=1\n")
+
+    assert load_env() == {
+        "youtube": "abc123", "YOUTUBE_API_KEY": "abc123", "RFAI_TEST_VALUE": "1",
+    }
+
+
+def test_first_assignment_wins_without_override(dotenv):
+    dotenv.write_text("youtube=first\nYOUTUBE_API_KEY=second\n")
+
+    assert load_env()["YOUTUBE_API_KEY"] == "first"
+    load_env.cache_clear()
+    assert load_env(override=True)["YOUTUBE_API_KEY"] == "second"
+
+
+def test_existing_environment_is_kept_without_override(dotenv, monkeypatch):
+    monkeypatch.setenv("RFAI_TEST_VALUE", "from-shell")
+    dotenv.write_text("RFAI_TEST_VALUE=from-file\n")
+
+    assert "RFAI_TEST_VALUE" not in load_env()
+    assert env.os.environ["RFAI_TEST_VALUE"] == "from-shell"
+
+
+def test_file_is_read_once_until_cache_clear(dotenv):
+    dotenv.write_text("RFAI_TEST_VALUE=1\n")
+    assert load_env() == {"RFAI_TEST_VALUE": "1"}
+
+    dotenv.write_text("RFAI_TEST_VALUE=2\n")
+    assert load_env() == {"RFAI_TEST_VALUE": "1"}
+
+    load_env.cache_clear()
+    assert load_env(override=True) == {"RFAI_TEST_VALUE": "2"}
+
+
+def test_dotenv_lookup_is_cached_per_explicit_path(dotenv, tmp_path, monkeypatch):
+    dotenv.write_text("")
+    assert env._find_dotenv() == dotenv.resolve()
+
+    other = tmp_path / "other.env"
+    other.write_text("")
+    monkeypatch.setenv("RFAI_ENV_FILE", str(other))
+    assert env._find_dotenv() == other.resolve()
+
+    monkeypatch.setenv("RFAI_ENV_FILE", str(tmp_path / "missing.env"))
+    assert env._find_dotenv() is None
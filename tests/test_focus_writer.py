@@ -0,0 +1,59 @@
+"""
+Tests for the batched focus_states writer shared by both focus detectors
+"""
+
+import sqlite3
+
+import pytest
+
+from database.init_db import init_database
+from rfai.daemons.focus_detector import FOCUS_FLUSH_ROWS, FocusStateWriter
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "rfai.db"
+    init_database(path)
+    return path
+
+
+def sample(state):
+    return {'state': state, 'confidence': 0.9, 'signals': {'keyboard': 0.5}}
+
+
+def logged_states(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return [row[0] for row in conn.execute(
+            "SELECT state FROM focus_states ORDER BY rowid"
+        )]
+
+
+def test_state_change_is_written_immediately(db_path):
+    writer = FocusStateWriter(db_path)
+    writer.log(sample('FOCUSED'))
+    writer.log(sample('FOCUSED'))
+    assert logged_states(db_path) == ['FOCUSED']
+
+    writer.log(sample('DISTRACTED'))
+    assert logged_states(db_path) == ['FOCUSED', 'FOCUSED', 'DISTRACTED']
+    writer.close()
+
+
+def test_steady_state_waits_for_a_full_batch(db_path):
+    writer = FocusStateWriter(db_path)
+    writer.log(sample('ACTIVE'))
+    for _ in range(FOCUS_FLUSH_ROWS - 1):
+        writer.log(sample('ACTIVE'))
+    assert len(logged_states(db_path)) == 1
+
+    writer.log(sample('ACTIVE'))
+    assert len(logged_states(db_path)) == FOCUS_FLUSH_ROWS + 1
+    writer.close()
+
+
+def test_close_drains_the_batch(db_path):
+    writer = FocusStateWriter(db_path)
+    for _ in range(3):
+        writer.log(sample('ACTIVE'))
+    writer.close()
+    assert logged_states(db_path) == ['ACTIVE'] * 3
@@ -0,0 +1,151 @@
+"""
+Tests for the trigger-maintained progress_summary table
+"""
+
+import sqlite3
+import uuid
+
+import pytest
+
+from rfai.ai.progress_tester import ProgressTester
+
+DIRECT_AGGREGATE_SQL = """
+    SELECT COALESCE(q.topic, ''), COUNT(*), TOTAL(qr.score_percentage),
+           MAX(qr.score_percentage), MIN(qr.score_percentage)
+    FROM quiz_results qr
+    JOIN quizzes q ON qr.quiz_id = q.quiz_id
+    GROUP BY COALESCE(q.topic, '')
+    ORDER BY 1
+"""
+
+SUMMARY_SQL = """
+    SELECT topic, attempts, total_score, highest_score, lowest_score
+    FROM progress_summary
+    ORDER BY topic
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "progress.db"
+
+
+def make_tester(db_path, tmp_path):
+    return ProgressTester(db_path, config_path=tmp_path / "interests.json")
+
+
+def query(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def execute(db_path, *statements):
+    conn = sqlite3.connect(db_path)
+    try:
+        for sql, params in statements:
+            conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def take_quiz(tester, topic, correct):
+    """Submit a 4-question quiz with `correct` right answers"""
+    quiz = tester.generate_quiz(topic, num_questions=4)
+    answers = {
+        q['question_id']: 'a' if i < correct else 'b'
+        for i, q in enumerate(quiz['questions'])
+    }
+    tester.submit_quiz_answers(quiz['quiz_id'], answers)
+    return quiz['quiz_id']
+
+
+def insert_raw_result(db_path, quiz_id, score, submitted_at):
+    """Insert a result row directly, e.g. one saved without a score"""
+    execute(db_path, ("""
+        INSERT INTO quiz_results (result_id, quiz_id, submitted_at, score_percentage)
+        VALUES (?, ?, ?, ?)
+    """, (str(uuid.uuid4()), quiz_id, submitted_at, score)))
+
+
+def test_backfill_and_trigger_match_direct_aggregate(db_path, tmp_path):
+    tester = make_tester(db_path, tmp_path)
+    physics = take_quiz(tester, 'physics', 3)
+    take_quiz(tester, 'physics', 1)
+    take_quiz(tester, 'math', 4)
+
+    # Turn it into a database from before the summary existed, with legacy
+    # rows (one unscored) and the first version's trigger still installed
+    execute(
+        db_path,
+        ("DROP TRIGGER trg_quiz_results_summary_v2", ()),
+        ("DROP TABLE progress_summary", ()),
+        ("""CREATE TRIGGER trg_quiz_results_summary AFTER INSERT ON quiz_results
+            BEGIN SELECT 1; END""", ()),
+    )
+    insert_raw_result(db_path, physics, None, '2026-01-01T00:00:00')
+    insert_raw_result(db_path, physics, 90.0, '2026-01-02T00:00:00')
+
+    # A fresh tester backfills on first use
+    tester = make_tester(db_path, tmp_path)
+    tester.get_progress_summary()
+    assert query(db_path, SUMMARY_SQL) == query(db_path, DIRECT_AGGREGATE_SQL)
+    assert query(db_path, """
+        SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name
+    """) == [('trg_quiz_results_summary_v2',)]
+
+    # Later results, scored and unscored, go through the trigger
+    take_quiz(tester, 'math', 2)
+    take_quiz(tester, 'biology', 0)
+    biology = take_quiz(tester, 'biology', 4)
+    insert_raw_result(db_path, biology, None, '2026-01-03T00:00:00')
+    assert query(db_path, SUMMARY_SQL) == query(db_path, DIRECT_AGGREGATE_SQL)
+
+
+def test_unscored_result_does_not_reset_high_and_low(db_path, tmp_path):
+    tester = make_tester(db_path, tmp_path)
+    quiz_id = take_quiz(tester, 'chemistry', 2)
+    take_quiz(tester, 'chemistry', 4)
+    insert_raw_result(db_path, quiz_id, None, '2026-01-01T00:00:00')
+
+    assert query(db_path, SUMMARY_SQL) == [('chemistry', 3, 150.0, 100.0, 50.0)]
+
+    summary = tester.get_progress_summary()
+    assert summary['total_quizzes'] == 3
+    assert summary['highest_score'] == 100.0
+    assert summary['lowest_score'] == 50.0
+
+
+def test_topic_with_only_unscored_results(db_path, tmp_path):
+    tester = make_tester(db_path, tmp_path)
+    take_quiz(tester, 'art', 1)
+    history = tester.generate_quiz('history', num_questions=4)['quiz_id']
+    insert_raw_result(db_path, history, None, '2026-01-01T00:00:00')
+
+    summary = tester.get_progress_summary()
+    assert summary['total_quizzes'] == 2
+    assert summary['highest_score'] == 25.0
+    assert summary['lowest_score'] == 25.0
+
+    history_summary = tester.get_progress_summary(topic='history')
+    assert history_summary['highest_score'] is None
+    assert history_summary['lowest_score'] is None
+
+
+def test_summary_matches_recomputation_from_results(db_path, tmp_path):
+    tester = make_tester(db_path, tmp_path)
+    for topic, correct in [('a', 1), ('b', 3), ('a', 4), ('c', 0), ('b', 2)]:
+        take_quiz(tester, topic, correct)
+
+    scores = [score for (score,) in query(db_path, "SELECT score_percentage FROM quiz_results")]
+    summary = tester.get_progress_summary()
+
+    assert summary['total_quizzes'] == len(scores)
+    assert summary['average_score'] == pytest.approx(sum(scores) / len(scores))
+    assert summary['highest_score'] == max(scores)
+    assert summary['lowest_score'] == min(scores)
+    assert sorted(summary['topics_covered']) == ['a', 'b', 'c']
+    assert len(summary['recent_quizzes']) == len(scores)
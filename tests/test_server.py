@@ -0,0 +1,95 @@
+"""
+Flask test-client tests for API endpoints
+"""
+
+import sqlite3
+
+import pytest
+
+
+def test_training_dataset_accepts_days_in_range(client):
+    response = client.get('/api/data/training-dataset?days=30')
+    assert response.status_code == 200
+    assert response.get_json()['period_days'] == 30
+
+
+def test_training_dataset_defaults_to_a_week(client):
+    response = client.get('/api/data/training-dataset')
+    assert response.status_code == 200
+    assert response.get_json()['period_days'] == 7
+
+
+def test_training_dataset_rejects_unbounded_days(client):
+    # Each distinct value would otherwise become its own cached dataset
+    for days in ('0', '366', '100000', 'abc'):
+        response = client.get(f'/api/data/training-dataset?days={days}')
+        assert response.status_code == 400, days
+        assert 'error' in response.get_json()
+
+
+def saved_ratings(app):
+    conn = sqlite3.connect(app.config['RFAI_DB_PATH_STR'])
+    try:
+        return conn.execute(
+            "SELECT id, content_id, rating, tags, time_spent_seconds FROM ratings ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def test_bulk_ratings_saves_every_item(app, client):
+    response = client.post('/api/ratings/bulk', json=[
+        {'content_id': 'video-1', 'rating': 5, 'tags': ['deep'], 'time_spent_seconds': 600},
+        {'content_id': 'paper-2', 'rating': 3},
+    ])
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] is True
+    assert body['count'] == 2
+
+    rows = saved_ratings(app)
+    assert [row[0] for row in rows] == sorted(body['rating_ids'])
+    assert {row[1:] for row in rows} == {
+        ('video-1', 5, '["deep"]', 600),
+        ('paper-2', 3, '[]', 0),
+    }
+
+
+def test_bulk_ratings_accepts_wrapped_list(app, client):
+    response = client.post('/api/ratings/bulk', json={
+        'ratings': [{'content_id': 'movie-1', 'rating': 4}],
+    })
+    assert response.status_code == 200
+    assert response.get_json()['count'] == 1
+    assert len(saved_ratings(app)) == 1
+
+
+@pytest.mark.parametrize('payload', [
+    # One out-of-range rating rejects the whole batch
+    [{'content_id': 'a', 'rating': 4}, {'content_id': 'b', 'rating': 9}],
+    # Missing and empty content ids
+    [{'content_id': 'a', 'rating': 4}, {'rating': 2}],
+    [{'content_id': 'a', 'rating': 4}, {'content_id': '', 'rating': 2}],
+    # Wrong type inside an otherwise valid list
+    [{'content_id': 'a', 'rating': 'five'}],
+])
+def test_bulk_ratings_partially_invalid_payload_writes_nothing(app, client, payload):
+    response = client.post('/api/ratings/bulk', json=payload)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+    assert saved_ratings(app) == []
+
+
+@pytest.mark.parametrize('payload', [[], {'ratings': []}])
+def test_bulk_ratings_rejects_empty_list(app, client, payload):
+    response = client.post('/api/ratings/bulk', json=payload)
+    assert response.status_code == 400
+    assert saved_ratings(app) == []
+
+
+def test_bulk_ratings_rejects_malformed_json(app, client):
+    response = client.post(
+        '/api/ratings/bulk', data=b'[{"content_id": ', content_type='application/json'
+    )
+    assert response.status_code == 400
+    assert saved_ratings(app) == []